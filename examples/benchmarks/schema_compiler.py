@@ -0,0 +1,123 @@
+"""Benchmark remote tool class generation.
+
+Compares the previous `datamodel-code-generator` + ruff + `exec` pipeline against
+`pybotchi.schema.build_model`. The legacy path is only measured when
+`datamodel-code-generator[ruff]` is installed.
+
+Usage: python examples/benchmarks/schema_compiler.py [rounds]
+"""
+
+from sys import argv
+from time import perf_counter
+from typing import Any, Callable
+
+from orjson import dumps
+
+from pybotchi.schema import build_model
+
+SCHEMAS: dict[str, dict[str, Any]] = {
+    "get_weather": {
+        "type": "object",
+        "properties": {
+            "location": {"type": "string", "description": "City name"},
+            "unit": {"enum": ["celsius", "fahrenheit"], "default": "celsius"},
+        },
+        "required": ["location"],
+    },
+    "search_issues": {
+        "type": "object",
+        "properties": {
+            "jql": {"type": "string", "description": "JQL query"},
+            "fields": {"type": "array", "items": {"type": "string"}},
+            "limit": {"anyOf": [{"type": "integer", "minimum": 1, "maximum": 50}, {"type": "null"}], "default": 10},
+            "start_at": {"type": "integer", "default": 0},
+            "expand": {"anyOf": [{"type": "string"}, {"type": "null"}], "default": None},
+        },
+        "required": ["jql"],
+    },
+    "create_issue": {
+        "type": "object",
+        "properties": {
+            "project_key": {"type": "string"},
+            "summary": {"type": "string"},
+            "issue_type": {"enum": ["Bug", "Task", "Story", "Epic"]},
+            "assignee": {"$ref": "#/$defs/User"},
+            "components": {"type": "array", "items": {"$ref": "#/$defs/Component"}},
+            "additional_fields": {"type": "object", "additionalProperties": {"type": "string"}},
+        },
+        "required": ["project_key", "summary", "issue_type"],
+        "$defs": {
+            "User": {
+                "type": "object",
+                "properties": {"account_id": {"type": "string"}, "email": {"type": "string"}},
+                "required": ["account_id"],
+            },
+            "Component": {
+                "type": "object",
+                "properties": {"id": {"type": "string"}, "name": {"type": "string"}},
+                "required": ["id"],
+            },
+        },
+    },
+}
+
+
+def build_legacy(schema: dict[str, Any], class_name: str) -> Any:
+    """Build model through the legacy code generation pipeline."""
+    from datamodel_code_generator import DataModelType, Formatter, PythonVersion
+    from datamodel_code_generator.model import get_data_model_types
+    from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
+
+    dmt = get_data_model_types(DataModelType.PydanticV2BaseModel, target_python_version=PythonVersion.PY_313)
+    globals: dict[str, Any] = {}
+    exec(
+        JsonSchemaParser(
+            dumps(schema).decode(),
+            data_model_type=dmt.data_model,
+            data_model_root_type=dmt.root_model,
+            data_model_field_type=dmt.field_model,
+            data_type_manager_type=dmt.data_type_manager,
+            dump_resolve_reference_action=dmt.dump_resolve_reference_action,
+            class_name=class_name,
+            strict_nullable=True,
+            formatters=[Formatter.RUFF_FORMAT, Formatter.RUFF_CHECK],
+        )
+        .parse()
+        .removeprefix("from __future__ import annotations"),  # type: ignore[union-attr]
+        globals,
+    )
+    return globals[class_name]
+
+
+def measure(builder: Callable[[dict[str, Any], str], Any], rounds: int) -> dict[str, float]:
+    """Measure average build time per tool in milliseconds."""
+    timings: dict[str, float] = {}
+    for name, schema in SCHEMAS.items():
+        builder(schema, name.title().replace("_", ""))
+        start = perf_counter()
+        for _ in range(rounds):
+            builder(schema, name.title().replace("_", ""))
+        timings[name] = (perf_counter() - start) / rounds * 1000
+    return timings
+
+
+def main() -> None:
+    """Run benchmark."""
+    rounds = int(argv[1]) if len(argv) > 1 else 20
+
+    after = measure(build_model, rounds)
+    try:
+        before: dict[str, float] | None = measure(build_legacy, max(rounds // 4, 1))
+    except ImportError:
+        before = None
+
+    print(f"{'tool':<16}{'before (ms)':>14}{'after (ms)':>14}{'speedup':>10}")
+    for name, timing in after.items():
+        if before:
+            print(f"{name:<16}{before[name]:>14.2f}{timing:>14.3f}{before[name] / timing:>9.0f}x")
+        else:
+            print(f"{name:<16}{'n/a':>14}{timing:>14.3f}{'':>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark child tool binding for a 50-child agent.
+
+Compares binding all children on every `child_selection` (cache cleared per round)
+against the cached bindings in `pybotchi.action.TOOL_BINDINGS`. Uses an offline
+chat model whose `bind_tools` converts tools the same way provider integrations do.
+
+Usage: python examples/benchmarks/tool_bindings.py [rounds] [children]
+"""
+
+from asyncio import run
+from sys import argv
+from time import perf_counter
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import Field
+
+from pybotchi import LLM, Action, Context
+from pybotchi.action import TOOL_BINDINGS
+
+
+class OfflineChatModel(BaseChatModel):
+    """Chat model that never calls any provider."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "offline"
+
+    def bind_tools(self, tools: Any, *, tool_choice: Any = None, **kwargs: Any) -> Any:
+        """Bind tools like provider integrations do."""
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], tool_choice=tool_choice, **kwargs)
+
+    def _generate(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=""))])
+
+
+def build_agent(children: int) -> type[Action]:
+    """Build agent with `children` child actions."""
+
+    class Agent(Action):
+        """Agent with many children."""
+
+    for index in range(children):
+        Agent.add_child(
+            type(
+                f"Child{index}",
+                (Action,),
+                {
+                    "__doc__": f"Child action number {index}.",
+                    "__annotations__": {"query": str, "limit": int, "tags": list[str]},
+                    "query": Field(description="Search query"),
+                    "limit": Field(10, ge=1, le=100, description="Max results"),
+                    "tags": Field(default_factory=list, description="Tags"),
+                },
+            ),
+            extended=False,
+        )
+    return Agent
+
+
+async def measure(agent: Action, context: Context, rounds: int, cached: bool) -> float:
+    """Measure average binding time in milliseconds."""
+    child_actions = await agent.get_child_actions(context)
+    await agent.bind_child_actions(context, child_actions, "required")
+    start = perf_counter()
+    for _ in range(rounds):
+        if not cached:
+            TOOL_BINDINGS.clear()
+        await agent.bind_child_actions(context, child_actions, "required")
+    return (perf_counter() - start) / rounds * 1000
+
+
+async def main() -> None:
+    """Run benchmark."""
+    rounds = int(argv[1]) if len(argv) > 1 else 50
+    children = int(argv[2]) if len(argv) > 2 else 50
+
+    LLM.add(base=OfflineChatModel())
+    agent = build_agent(children)()
+    context = Context(prompts=[{"role": "system", "content": "system"}])
+
+    before = await measure(agent, context, rounds, False)
+    after = await measure(agent, context, rounds, True)
+    print(f"{'children':<10}{'before (ms)':>14}{'after (ms)':>14}{'speedup':>10}")
+    print(f"{children:<10}{before:>14.3f}{after:>14.4f}{before / after:>9.0f}x")
+
+
+if __name__ == "__main__":
+    run(main())
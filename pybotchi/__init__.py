@@ -1,15 +1,21 @@
 """Pybotchi."""
 
-from .action import DEFAULT_ACTION, Action, all_agents, graph
+from .action import DEFAULT_ACTION, Action, ActionStub, all_agents, graph
+from .cache import LLM_CACHE
 from .common import ActionResult, ActionReturn, ChatRole, Groups, Stop, UsageMetadata
 from .context import Context
-from .llm import LLM
+from .llm import LLM, LLMPool
+from .loop import LoopPool
+from .resource import Resource
+from .router import ClassifierRouter, KeywordRouter, RegexRouter, Router
 
 __all__ = [
     "DEFAULT_ACTION",
     "Action",
+    "ActionStub",
     "all_agents",
     "graph",
+    "LLM_CACHE",
     "ActionResult",
     "ActionReturn",
     "ChatRole",
@@ -18,4 +24,11 @@ __all__ = [
     "UsageMetadata",
     "Context",
     "LLM",
+    "LLMPool",
+    "LoopPool",
+    "Resource",
+    "ClassifierRouter",
+    "KeywordRouter",
+    "RegexRouter",
+    "Router",
 ]
@@ -2,25 +2,34 @@
 
 from __future__ import annotations
 
-from asyncio import TaskGroup
+from asyncio import Event, TaskGroup
 from collections import deque
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Hashable
+from contextlib import AsyncExitStack
+from functools import cached_property
+from heapq import heappop, heappush
 from inspect import getmembers
 from os import getenv
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, PrivateAttr, ValidationError
 
+from .cache import LRUCache
 from .common import (
     ActionEntry,
     ActionResult,
     ActionReturn,
+    ChatRole,
     ConcurrentBreakPoint,
     Graph,
     Groups,
     ToolCall,
     UsageData,
 )
+from .llm import LLM
+from .process import in_worker, run_action
+from .resource import Resource, Semaphore
+from .router import Router
 from .utils import apply_placeholders, unwrap_exceptions, uuid
 
 if TYPE_CHECKING:
@@ -76,11 +85,14 @@ ${system}
 """.strip(),
 )
 
+TOOL_BINDINGS: LRUCache[Hashable, tuple[Any, ...]] = LRUCache(int(getenv("TOOL_BINDINGS_SIZE", "1024")))
+
 TAction = TypeVar("TAction", bound="Action")
 TContext = TypeVar("TContext", bound="Context")
 T = TypeVar("T")
 
-type ChildActions = dict[str, type["Action"]]
+type ActionClasses = dict[str, type["Action"]]
+type ChildActions = dict[str, type["Action"] | "ActionStub"]
 
 
 class Action(BaseModel, Generic[TContext]):
@@ -96,9 +108,19 @@ class Action(BaseModel, Generic[TContext]):
     __max_iteration_prompt__: str | None = None
     __temperature__: float | None = None
     __max_child_selection_prompts__: int | None = None
+    __max_child_selection_tokens__: int | None = None
     __default_tool__ = DEFAULT_ACTION
     __first_tool_only__ = False
     __concurrent__ = False
+    __executor__: Literal["process"] | None = None
+    __llm_cache__: bool = bool(int(getenv("LLM_CACHE_ENABLED", "0")))
+    __llm_cache_ttl__: float | None = None
+    __semantic_cache__: float | None = None
+    __llm_single_flight__: bool = bool(int(getenv("LLM_SINGLE_FLIGHT_ENABLED", "0")))
+    __hedge__: str | None = None
+    __hedge_percentile__: float | None = None
+    __selection_llms__: list[str] | None = None
+    __router__: Router | None = None
 
     __has_pre__: bool
     __has_fallback__: bool
@@ -110,7 +132,10 @@ class Action(BaseModel, Generic[TContext]):
 
     __max_self_recursion__: int | None = None
     __max_iteration__: int | None = None
-    __child_actions__: ChildActions
+    __max_concurrency__: int | None = None
+    __resource__: str | None = None
+    __depends_on__: tuple[str | type[Action], ...] = ()
+    __child_actions__: ActionClasses
 
     # --------------------- not inheritable -------------------- #
 
@@ -146,7 +171,7 @@ class Action(BaseModel, Generic[TContext]):
         cls.__has_on_child_init_error__ = cls.on_child_init_error is not Action.on_child_init_error
         cls.__has_on_error__ = cls.on_error is not Action.on_error
         cls.__has_post__ = cls.post is not Action.post
-        cls.__has_as_tool__ = cls._as_tool is not Action._as_tool
+        cls.__has_as_tool__ = cls._as_tool.__func__ is not Action._as_tool.__func__  # type: ignore[attr-defined]
         cls.__detached__ = src.get("__detached__", cls.commit_context is not Action.commit_context)
         cls.__groups__ = src.get("__groups__")
         cls.__to_commit__ = src.get("__to_commit__", True)
@@ -218,20 +243,16 @@ class Action(BaseModel, Generic[TContext]):
             else context.llm
         )
 
-        message = await llm.ainvoke(
+        message = await context.invoke_llm(
+            self,
+            llm,
             [
                 {
                     "content": self.max_iteration_prompt(context),
                     "role": "system",
                 },
-                *context.shifted_prompts(self.__max_child_selection_prompts__),
-            ]
-        )
-
-        await context.add_usage(
-            self,
-            context.llm_model,
-            message.usage_metadata,
+                *context.shifted_prompts(self.__max_child_selection_prompts__, self.__max_child_selection_tokens__),
+            ],
             "$finalize",
         )
 
@@ -279,18 +300,36 @@ class Action(BaseModel, Generic[TContext]):
             if context.allowed_actions.get(name, child.__enabled__)
         }
 
-    async def child_selection(
+    async def bind_child_actions(
         self,
         context: TContext,
-        child_actions: ChildActions | None = None,
-    ) -> tuple[list["Action"], str]:
-        """Execute tool selection process."""
-        if child_actions is None:
-            child_actions = await self.get_child_actions(context)
-
-        tool_choice = "auto" if self.__has_fallback__ else ("any" if context.llm_is_anthropic else "required")
+        child_actions: ChildActions,
+        tool_choice: str,
+        llm: Any | None = None,
+    ) -> Any:
+        """Bind child actions as tools to llm (default: context llm).
+
+        Bindings are cached per class, child set, tool_choice, parallel_tool_calls,
+        temperature and LLM unless a child overrides `_as_tool` (context dependent).
+        """
+        base = context.llm if llm is None else llm
+        key: Hashable | None = None
+        if not any(child.__has_as_tool__ and not isinstance(child, ActionStub) for child in child_actions.values()):
+            key = (
+                self.__class__,
+                tuple(
+                    (name, id(child.schema)) if isinstance(child, ActionStub) else (name, child)
+                    for name, child in child_actions.items()
+                ),
+                tool_choice,
+                not self.__first_tool_only__,
+                self.__temperature__,
+                id(base),
+            )
+            if (cached := TOOL_BINDINGS.get(key)) is not None:
+                return cached[0]
 
-        llm = context.llm.bind_tools(
+        llm = base.bind_tools(
             [await child._as_tool(context) if child.__has_as_tool__ else child for child in child_actions.values()],
             tool_choice=tool_choice,
             parallel_tool_calls=not self.__first_tool_only__,
@@ -298,42 +337,121 @@ class Action(BaseModel, Generic[TContext]):
         if self.__temperature__ is not None:
             llm = llm.with_config(configurable={"llm_temperature": self.__temperature__})
 
-        message = await llm.ainvoke(
-            [
-                {
-                    "content": self.child_selection_prompt(context, tool_choice),
-                    "role": "system",
-                },
-                *context.shifted_prompts(self.__max_child_selection_prompts__),
-            ]
-        )
-        await context.add_usage(
-            self,
-            context.llm_model,
-            message.usage_metadata,
-            "$tool",
-        )
+        if key is not None:
+            # keep referenced objects alive so their ids stay unique while cached
+            TOOL_BINDINGS.set(
+                key,
+                (llm, base, [child.schema for child in child_actions.values() if isinstance(child, ActionStub)]),
+            )
+        return llm
+
+    async def child_selection(
+        self,
+        context: TContext,
+        child_actions: ChildActions | None = None,
+    ) -> tuple[list["Action"], str]:
+        """Execute tool selection process.
+
+        With `__selection_llms__`, registry llms are tried in order. The next one is
+        only used when the response is unusable: no tool call while required, unknown
+        tool name or tool arguments failing validation.
+        """
+        if child_actions is None:
+            child_actions = await self.get_child_actions(context)
+
+        tiers: list[str | None] = [*self.__selection_llms__] if self.__selection_llms__ else [None]
+        for index, tier in enumerate(tiers):
+            escalate = index < len(tiers) - 1
+            if tier is None:
+                base = context.llm
+            elif (base := LLM.get(tier)) is None:
+                raise NotImplementedError(f"`{tier}` LLM from `__selection_llms__` is not yet available!")
+            if self.__has_fallback__:
+                tool_choice = "auto"
+            elif context.llm_is_anthropic if tier is None else context.is_anthropic(base):
+                tool_choice = "any"
+            else:
+                tool_choice = "required"
+            llm = await self.bind_child_actions(context, child_actions, tool_choice, base)
+
+            message = await context.invoke_llm(
+                self,
+                llm,
+                [
+                    {
+                        "content": self.child_selection_prompt(context, tool_choice),
+                        "role": "system",
+                    },
+                    *context.shifted_prompts(self.__max_child_selection_prompts__, self.__max_child_selection_tokens__),
+                ],
+                "$tool",
+                self.__semantic_cache__,
+                tier,
+            )
+
+            if escalate and (
+                (tool_choice != "auto" and not message.tool_calls)
+                or any(call["name"] not in child_actions for call in message.tool_calls)
+            ):
+                continue
+
+            next_actions: list[Action] = []
+            invalid = False
+            for call in message.tool_calls:
+                if isinstance(child_action := child_actions[call["name"]], ActionStub):
+                    child_action = child_action.action
+                try:
+                    next_actions.append(child_action(**call["args"]))
+                except Exception as error:
+                    if escalate and isinstance(error, ValidationError):
+                        invalid = True
+                        break
+                    if self.__has_on_child_init_error__:
+                        if (
+                            error_message := await self.on_child_init_error(
+                                context,
+                                next_actions,
+                                child_action,
+                                call["args"],
+                                error,
+                            )
+                        ) is not None:
+                            return [], error_message
+                    else:
+                        raise error
+
+            if not invalid:
+                break
+        return next_actions, message.text
+
+    async def route_child_actions(self, context: TContext, child_actions: ChildActions) -> list["Action"] | None:
+        """Select child actions with `__router__`, None when it is not confident.
+
+        Only fresh user turns are routed, so later iterations (after tool responses)
+        go to `child_selection`. Routed args failing validation also fall back to it.
+        """
+        if (
+            self.__router__ is None
+            or not context.prompts
+            or context.prompts[-1]["role"] != ChatRole.USER
+            or not (
+                routes := self.__router__.route(
+                    context.semantic_cache_text(context.prompts, self.__router__.turns),
+                    child_actions,
+                )
+            )
+        ):
+            return None
 
         next_actions: list[Action] = []
-        for call in message.tool_calls:
-            child_action = child_actions[call["name"]]
+        for route in routes:
+            if isinstance(child_action := child_actions[route["name"]], ActionStub):
+                child_action = child_action.action
             try:
-                next_actions.append(child_action(**call["args"]))
-            except Exception as error:
-                if self.__has_on_child_init_error__:
-                    if (
-                        error_message := await self.on_child_init_error(
-                            context,
-                            next_actions,
-                            child_action,
-                            call["args"],
-                            error,
-                        )
-                    ) is not None:
-                        return [], error_message
-                else:
-                    raise error
-        return next_actions, message.text
+                next_actions.append(child_action(**route["args"]))
+            except ValidationError:
+                return None
+        return next_actions
 
     async def execute(self, context: TContext, parent: Action | None = None, append: bool = True) -> ActionResult:
         """Execute main process."""
@@ -351,32 +469,10 @@ class Action(BaseModel, Generic[TContext]):
             if context.check_self_recursion(self):
                 return ActionReturn.STOP
 
-            if self.__has_pre__ and (result := await self.pre(context)) and result.is_end:
-                return result
-
-            if self.__max_iteration__:
-                iteration = 0
-                while iteration < self.__max_iteration__:
-                    if (result := await self.execution(context)) and result.is_break:
-                        break
-                    iteration += 1
-                if (
-                    result
-                    and result.is_stop
-                    or (
-                        iteration >= self.__max_iteration__
-                        and (result := await self.on_max_iteration(context))
-                        and result.is_end
-                    )
-                ):
-                    return result
-            elif (result := await self.execution(context)) and result.is_end:
-                return result
-
-            if self.__has_post__ and (result := await self.post(context)) and result.is_end:
-                return result
+            if self.__executor__ == "process" and not in_worker():
+                return await self.execute_in_process(context)
 
-            return result
+            return await self.execute_lifecycle(context)
         except Exception as exception:
             if not self.__has_on_error__:
                 self.__to_commit__ = False
@@ -391,22 +487,109 @@ class Action(BaseModel, Generic[TContext]):
                 return result
             return result
         finally:
+            if context is not parent_context:
+                await context.wait_compaction()
             if self.__to_commit__ and self.__detached__:
                 await self.commit_context(parent_context, context)
 
-    async def execute_concurrently(self, context: TContext, parent: Action | None = None, append: bool = True) -> None:
-        """Execute main process concurrently."""
-        if (result := await self.execute(context, parent, append)) and result.is_break:
-            raise ConcurrentBreakPoint(result)
+    async def execute_lifecycle(self, context: TContext) -> ActionResult:
+        """Execute pre, execution (iterations) and post."""
+        result = None
+        if self.__has_pre__ and (result := await self.pre(context)) and result.is_end:
+            return result
+
+        if self.__max_iteration__:
+            iteration = 0
+            while iteration < self.__max_iteration__:
+                if (result := await self.execution(context)) and result.is_break:
+                    break
+                iteration += 1
+            if (
+                result
+                and result.is_stop
+                or (
+                    iteration >= self.__max_iteration__
+                    and (result := await self.on_max_iteration(context))
+                    and result.is_end
+                )
+            ):
+                return result
+        elif (result := await self.execution(context)) and result.is_end:
+            return result
+
+        if self.__has_post__ and (result := await self.post(context)) and result.is_end:
+            return result
+
+        return result
+
+    async def execute_in_process(self, context: TContext) -> ActionResult:
+        """Execute lifecycle on a worker process and merge its context back.
+
+        The worker gets the action args and `detached_kwargs` as context snapshot.
+        Appended prompts, changed metadata keys, usages and the action trace are
+        merged back. Notifications are not relayed. Errors, detaching and commits
+        are handled by `execute` on this process.
+        """
+        snapshot = context.detached_kwargs()
+        outcome = await context.run_func_in_process(
+            run_action,
+            None,
+            context.__class__,
+            snapshot,
+            self.__class__,
+            self.model_dump(),
+        )
+
+        context.prompts.extend(outcome["prompts"])
+        for key, value in outcome["metadata"].items():
+            if key not in snapshot["metadata"] or snapshot["metadata"][key] != value:
+                context.metadata[key] = value
+        for model, usage in outcome["usages"].items():
+            await context.merge_to_usages(model, usage)
+        self._usage.extend(outcome["entry"]["usages"])
+        self._actions.extend(outcome["entry"]["actions"])
+        return outcome["result"]
+
+    async def execute_concurrently(
+        self,
+        context: TContext,
+        parent: Action | None = None,
+        append: bool = True,
+        limit: Semaphore | None = None,
+    ) -> None:
+        """Execute main process concurrently once parent and resource slots are available."""
+        async with AsyncExitStack() as stack:
+            semaphores = [
+                semaphore
+                for semaphore in (limit, Resource.get(self.__resource__) if self.__resource__ else None)
+                if semaphore is not None
+            ]
+            if semaphores:
+                wait = 0.0
+                for semaphore in semaphores:
+                    wait += await stack.enter_async_context(semaphore.slot())
+
+                await context.notify(
+                    {
+                        "event": "tool",
+                        "type": "queue",
+                        "status": "completed",
+                        "data": {"action": self.__display_name__, "resource": self.__resource__, "wait": wait},
+                    }
+                )
+
+            if (result := await self.execute(context, parent, append)) and result.is_break:
+                raise ConcurrentBreakPoint(result)
 
     async def execution(self, context: TContext) -> ActionResult:
         """Execute core process."""
         result = None
+        context.compact()
         child_actions = await self.get_child_actions(context)
         if (
             len(child_actions) == 1
-            and not (action := next(iter(child_actions.values()))).model_fields
             and not self.__has_fallback__
+            and not (action := next(iter(child_actions.values()))).model_fields
         ):
             if (result := await action().execute(context, self)) and result.is_break:  # type: ignore[call-arg]
                 return result
@@ -420,7 +603,12 @@ class Action(BaseModel, Generic[TContext]):
                 }
             )
 
-            next_actions, content = await self.child_selection(context, child_actions)
+            content = ""
+            if (
+                self.__router__ is None
+                or (next_actions := await self.route_child_actions(context, child_actions)) is None
+            ):
+                next_actions, content = await self.child_selection(context, child_actions)
             self._children = next_actions
 
             await context.notify(
@@ -436,14 +624,16 @@ class Action(BaseModel, Generic[TContext]):
                 if self.__first_tool_only__ or len(next_actions) == 1:
                     if (result := await next_actions[0].execute(context, self)) and result.is_break:
                         return result
-                elif (
-                    result := await (
-                        self.concurrent_children_execution
-                        if any(True for na in next_actions if na.__concurrent__)
-                        else self.sequential_children_execution
-                    )(context, next_actions)
-                ) and result.is_break:
-                    return result
+                else:
+                    if any(True for na in next_actions if na.__depends_on__):
+                        children_execution = self.dependent_children_execution
+                    elif any(True for na in next_actions if na.__concurrent__):
+                        children_execution = self.concurrent_children_execution
+                    else:
+                        children_execution = self.sequential_children_execution
+
+                    if (result := await children_execution(context, next_actions)) and result.is_break:
+                        return result
             elif self.__has_fallback__ and (result := await self.fallback(context, content)) and result.is_end:
                 return result
         elif self.__has_fallback__:
@@ -462,14 +652,7 @@ class Action(BaseModel, Generic[TContext]):
                 }
             )
 
-            message = await llm.ainvoke(context.prompts)
-
-            await context.add_usage(
-                self,
-                context.llm_model,
-                message.usage_metadata,
-                "$fallback",
-            )
+            message = await context.invoke_llm(self, llm, context.prompts, "$fallback")
 
             await context.notify(
                 {
@@ -489,26 +672,88 @@ class Action(BaseModel, Generic[TContext]):
         """Run children execution with concurrent."""
         result = None
         break_point = None
+        limit = Semaphore(self.__max_concurrency__) if self.__max_concurrency__ else None
         try:
             async with TaskGroup() as tg:
                 for next_action in next_actions:
                     self._actions.append(next_action)
                     if next_action.__concurrent__:
-                        tg.create_task(next_action.execute_concurrently(context, self, False))
+                        tg.create_task(next_action.execute_concurrently(context, self, False, limit))
                     elif (result := await next_action.execute(context, self, False)) and result.is_break:
                         return result
         except* ConcurrentBreakPoint as eg:
-            queue = deque(eg.exceptions)
-            while queue:
-                que = queue.popleft()
-                if isinstance(que, ExceptionGroup):
-                    queue.extend(que.exceptions)
-                else:
-                    break_point = que.action_return
-                    break
+            break_point = unwrap_break_point(eg)
 
         return break_point or result
 
+    async def dependent_children_execution(self, context: TContext, next_actions: list[Action]) -> ActionResult:
+        """Run children as a dependency graph.
+
+        Each child waits for the selected siblings named in its `__depends_on__`
+        then runs; children with no pending dependencies run concurrently.
+        Dependencies that were not selected are ignored. Non concurrent children
+        also wait for the previous non concurrent child, keeping their order.
+        """
+        selected: dict[str, list[Action]] = {}
+        for next_action in next_actions:
+            selected.setdefault(next_action.__class__.__name__, []).append(next_action)
+
+        dependencies = {
+            id(next_action): list(
+                {
+                    id(dependency): dependency
+                    for name in next_action.__depends_on__
+                    for dependency in selected.get(name if isinstance(name, str) else name.__name__, ())
+                    if dependency is not next_action
+                }.values()
+            )
+            for next_action in next_actions
+        }
+
+        order = {id(next_action): index for index, next_action in enumerate(next_actions)}
+        pending = {key: len(deps) for key, deps in dependencies.items()}
+        ready = [(order[id(na)], na) for na in next_actions if not pending[id(na)]]
+        previous: Action | None = None
+        visited = 0
+        while ready:
+            _, current = heappop(ready)
+            visited += 1
+            if not current.__concurrent__:
+                if previous is not None:
+                    dependencies[id(current)].append(previous)
+                previous = current
+            for next_action in next_actions:
+                if any(dependency is current for dependency in dependencies[id(next_action)]):
+                    pending[id(next_action)] -= 1
+                    if not pending[id(next_action)]:
+                        heappush(ready, (order[id(next_action)], next_action))
+        if visited < len(next_actions):
+            raise ValueError(
+                f"Circular __depends_on__ between {[na.__display_name__ for na in next_actions if pending[id(na)]]}"
+            )
+
+        done = {id(next_action): Event() for next_action in next_actions}
+        limit = Semaphore(self.__max_concurrency__) if self.__max_concurrency__ else None
+
+        async def run(next_action: Action) -> None:
+            try:
+                for dependency in dependencies[id(next_action)]:
+                    await done[id(dependency)].wait()
+                await next_action.execute_concurrently(context, self, False, limit)
+            finally:
+                done[id(next_action)].set()
+
+        break_point = None
+        try:
+            async with TaskGroup() as tg:
+                for next_action in next_actions:
+                    self._actions.append(next_action)
+                    tg.create_task(run(next_action))
+        except* ConcurrentBreakPoint as eg:
+            break_point = unwrap_break_point(eg)
+
+        return break_point
+
     async def sequential_children_execution(self, context: TContext, next_actions: list[Action]) -> ActionResult:
         """Run children execution sequentially."""
         result = None
@@ -586,6 +831,77 @@ class Action(BaseModel, Generic[TContext]):
             ccls.remove_child(name)
 
 
+def unwrap_break_point(group: BaseExceptionGroup[ConcurrentBreakPoint]) -> ActionReturn | None:
+    """Get first break point from a concurrent exception group."""
+    queue: deque[BaseException] = deque(group.exceptions)
+    while queue:
+        que = queue.popleft()
+        if isinstance(que, BaseExceptionGroup):
+            queue.extend(que.exceptions)
+        elif isinstance(que, ConcurrentBreakPoint):
+            return que.action_return
+    return None
+
+
+class ActionStub:
+    """Lightweight child action holding only its tool schema.
+
+    Bound to the LLM as a raw tool definition. The Action class is only built
+    once the stub is selected (or called).
+    """
+
+    __enabled__ = True
+    __has_as_tool__ = True
+
+    def __init__(
+        self,
+        name: str,
+        description: str | None,
+        schema: dict[str, Any],
+        factory: Callable[[], type[Action]],
+    ) -> None:
+        """Build Action Stub."""
+        self.__name__ = self.__display_name__ = name
+        self.__doc__ = description
+        self.schema = schema
+        self.factory = factory
+
+    @cached_property
+    def action(self) -> type[Action]:
+        """Materialize Action class."""
+        return self.factory()
+
+    @property
+    def model_fields(self) -> dict[str, Any]:
+        """Get fields of the materialized Action class."""
+        if not self.schema.get("properties"):
+            return {}
+        return self.action.model_fields
+
+    def __call__(self, **kwargs: Any) -> Action:
+        """Instantiate materialized Action class."""
+        return self.action(**kwargs)
+
+    async def _as_tool(self, context: Context) -> dict[str, Any]:
+        """Convert stub to OpenAI tool definition."""
+        parameters = {key: value for key, value in self.schema.items() if key not in ("title", "description")}
+        parameters.setdefault("type", "object")
+        parameters.setdefault("properties", {})
+        return {
+            "type": "function",
+            "function": {
+                "name": self.__name__,
+                "description": self.__doc__ or "",
+                "parameters": parameters,
+            },
+        }
+
+
+def materialize(child_actions: ChildActions) -> ActionClasses:
+    """Build Action classes of all stubs."""
+    return {name: child.action if isinstance(child, ActionStub) else child for name, child in child_actions.items()}
+
+
 ##########################################################################
 #                            Action Utilities                            #
 ##########################################################################
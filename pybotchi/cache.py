@@ -0,0 +1,275 @@
+"""Pybotchi Caches."""
+
+from asyncio import AbstractEventLoop, CancelledError, Future, get_running_loop, shield, to_thread
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from hashlib import sha256
+from os import getenv
+from sqlite3 import Connection, connect
+from threading import Lock
+from time import time
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+from orjson import OPT_SORT_KEYS, dumps, loads
+
+if TYPE_CHECKING:
+    from .action import Action
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+TAction = TypeVar("TAction", bound="Action")
+
+
+def schema_hash(*data: Any) -> str:
+    """Generate stable hash of JSON compatible data."""
+    return sha256(dumps(data, option=OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded, thread safe LRU cache with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Get cache size."""
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        """Check if key is cached."""
+        return key in self._data
+
+    def get(self, key: K) -> V | None:
+        """Get cached value and mark it as recently used."""
+        with self._lock:
+            if (value := self._data.get(key)) is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache value and evict least recently used entries."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        """Remove cached value."""
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def invalidate(self, predicate: Callable[[K], bool]) -> int:
+        """Remove all entries matching the predicate."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+type ActionKey = tuple[str, str, str, type["Action"], type["Action"] | None]
+
+
+class ActionRegistry(LRUCache[ActionKey, type[TAction]]):
+    """Registry of generated remote action classes.
+
+    Keys are `(connection, tool, schema hash, action class, patch class)`
+    so identical schemas reuse one class across executions.
+    """
+
+    def invalidate_tools(self, connection: str, tool: str | None = None) -> int:
+        """Remove generated classes of a connection or a specific tool."""
+        if tool is None:
+            return self.invalidate(lambda key: key[0] == connection)
+        return self.invalidate(lambda key: key[0] == connection and key[1] == tool)
+
+
+class LLMCache:
+    """Exact-match LLM response cache.
+
+    Responses are kept in a memory LRU tier and, when `path` is set, a sqlite tier
+    shared across processes and restarts. Entries expire after their TTL; expired
+    sqlite rows are pruned at most once per `prune_interval`, `prune_batch` at a time.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        path: str | None = None,
+        ttl: float = 3600,
+        prune_interval: float = 60,
+        prune_batch: int = 1000,
+    ) -> None:
+        """Initialize cache."""
+        self.memory: LRUCache[str, tuple[dict[str, Any], float]] = LRUCache(maxsize)
+        self.path = path
+        self.ttl = ttl
+        self.prune_interval = prune_interval
+        self.prune_batch = prune_batch
+        self.pruned_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self._db: Connection | None = None
+        self._lock = Lock()
+
+    def _connect(self) -> Connection:
+        if self._db is None:
+            self._db = connect(self.path or ":memory:", check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_expires_at ON llm_cache (expires_at)")
+            self._db.commit()
+        return self._db
+
+    def _disk_get(self, key: str) -> tuple[dict[str, Any], float] | None:
+        with self._lock:
+            row = self._connect().execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return loads(row[0]), row[1]
+
+    def _disk_set(self, key: str, value: dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, dumps(value, default=str), expires_at),
+            )
+            if (now := time()) - self.pruned_at >= self.prune_interval:
+                self.pruned_at = now
+                db.execute(
+                    "DELETE FROM llm_cache WHERE rowid IN "
+                    "(SELECT rowid FROM llm_cache WHERE expires_at <= ? ORDER BY expires_at LIMIT ?)",
+                    (now, self.prune_batch),
+                )
+            db.commit()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Get cached response if not yet expired."""
+        entry = self.memory.get(key)
+        if entry is None and self.path and (entry := await to_thread(self._disk_get, key)) is not None:
+            self.memory.set(key, entry)
+
+        if entry is None or entry[1] <= time():
+            if entry is not None:
+                self.memory.pop(key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    async def set(self, key: str, value: dict[str, Any], ttl: float | None = None) -> None:
+        """Cache response."""
+        expires_at = time() + (self.ttl if ttl is None else ttl)
+        self.memory.set(key, (value, expires_at))
+        if self.path:
+            await to_thread(self._disk_set, key, value, expires_at)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self.memory.clear()
+        if self.path:
+            with self._lock:
+                self._connect().execute("DELETE FROM llm_cache")
+                self._connect().commit()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {"size": len(self.memory), "path": self.path, "hits": self.hits, "misses": self.misses}
+
+
+class SingleFlight(Generic[K, V]):
+    """Deduplicate concurrent calls with identical keys.
+
+    The first caller runs the call; callers arriving while it is in flight await the
+    same result. One registry per event loop. If the running call is cancelled,
+    waiting callers run it themselves.
+    """
+
+    def __init__(self) -> None:
+        """Initialize single flight."""
+        self.calls: WeakKeyDictionary[AbstractEventLoop, dict[K, Future[V]]] = WeakKeyDictionary()
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key: K, call: Callable[[], Awaitable[V]]) -> tuple[V, bool]:
+        """Run call once per key in flight and return result with shared flag."""
+        loop = get_running_loop()
+        if (calls := self.calls.get(loop)) is None:
+            calls = self.calls[loop] = {}
+
+        if (future := calls.get(key)) is not None:
+            try:
+                result = await shield(future)
+            except CancelledError:
+                if not future.cancelled():
+                    raise
+                return await self.do(key, call)
+            self.shared += 1
+            return result, True
+
+        future = calls[key] = loop.create_future()
+        self.executed += 1
+        try:
+            result = await call()
+        except CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exception:
+            future.set_exception(exception)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            calls.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Get single flight statistics."""
+        return {
+            "in_flight": sum(len(calls) for calls in self.calls.values()),
+            "executed": self.executed,
+            "shared": self.shared,
+        }
+
+
+LLM_CACHE = LLMCache(
+    int(getenv("LLM_CACHE_SIZE", "1024")),
+    getenv("LLM_CACHE_PATH") or None,
+    float(getenv("LLM_CACHE_TTL", "3600")),
+    float(getenv("LLM_CACHE_PRUNE_INTERVAL", "60")),
+    int(getenv("LLM_CACHE_PRUNE_BATCH", "1000")),
+)
+
+LLM_SINGLE_FLIGHT: SingleFlight[str, Any] = SingleFlight()
@@ -49,6 +49,7 @@ class UsageData(TypedDict):
     name: str | None
     model: str
     usage: UsageMetadata
+    tier: NotRequired[str]
 
 
 class ActionItem(TypedDict):
@@ -1,26 +1,63 @@
 """Pybotchi Context."""
 
-from asyncio import Future, get_event_loop, new_event_loop
-from collections.abc import Callable, Coroutine, Iterable, Iterator
+from asyncio import (
+    FIRST_COMPLETED,
+    Future,
+    Runner,
+    Task,
+    create_task,
+    get_event_loop,
+    get_running_loop,
+    wait,
+    wrap_future,
+)
+from collections.abc import Callable, Coroutine, Hashable, Iterable, Iterator
 from concurrent.futures import Executor
-from copy import deepcopy
 from functools import cached_property, partial
 from itertools import islice
+from math import ceil
 from os import getenv
+from time import perf_counter
 from typing import Any, ClassVar, Generic, ParamSpec, Self
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from orjson import dumps
 from pydantic import BaseModel, Field, PrivateAttr
 from typing_extensions import TypeVar
 
 from .action import Action, T, TAction
-from .common import UNSPECIFIED, ActionResult, ChatRole, ToolCall, UsageMetadata
+from .cache import LLM_CACHE, LLM_SINGLE_FLIGHT, schema_hash
+from .common import UNSPECIFIED, ActionResult, ChatRole, ToolCall, UsageData, UsageMetadata
 from .llm import LLM
+from .loop import LoopPool
+from .process import process_executor
+from .utils import CowDict
 
 TContext = TypeVar("TContext", bound="Context", default="Context")
 TLLM = TypeVar("TLLM", default=BaseChatModel)
 P = ParamSpec("P")
 
+ZERO_USAGE: UsageMetadata = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+CHARS_PER_TOKEN = float(getenv("CHARS_PER_TOKEN", "4"))
+COMPACTION_THRESHOLD = int(threshold) if (threshold := getenv("COMPACTION_THRESHOLD")) else None
+COMPACTION_KEEP_TOKENS = int(getenv("COMPACTION_KEEP_TOKENS", "4000"))
+COMPACTION_LLM = getenv("COMPACTION_LLM", "compaction")
+DEFAULT_COMPACTION_PROMPT: str = getenv(
+    "DEFAULT_COMPACTION_PROMPT",
+    """
+You are an AI assistant responsible for compacting conversation history.
+Summarize the conversation transcript provided by the user so it can replace the original messages.
+
+# Compaction Guidelines:
+- Keep every fact, decision, user preference and constraint that later turns may rely on.
+- Keep results of tool calls that are still relevant, including identifiers, numbers and names verbatim.
+- Keep open questions and unfinished tasks.
+- Drop greetings, repetition and intermediate reasoning that no longer matters.
+- Write in third person and do not address the user.
+""".strip(),
+)
+
 
 class Context(BaseModel, Generic[TLLM]):
     """Context Handler."""
@@ -34,6 +71,13 @@ class Context(BaseModel, Generic[TLLM]):
     parent: Self | None = None
 
     _action_call: dict[str, int] = PrivateAttr(default_factory=dict)
+    _token_counts: dict[int, tuple[dict[str, Any], int]] = PrivateAttr(default_factory=dict)
+    _compaction: Task[None] | None = PrivateAttr(None)
+    _compaction_saved: int = PrivateAttr(0)
+    _shared_calls: dict[str, int] = PrivateAttr(default_factory=dict)
+    _compaction_threshold: ClassVar[int | None] = COMPACTION_THRESHOLD
+    _compaction_keep_tokens: ClassVar[int] = COMPACTION_KEEP_TOKENS
+    _compaction_llm: ClassVar[str] = COMPACTION_LLM
     _model_source: ClassVar[list[str]] = getenv(
         "MODEL_NAME_SOURCE",
         "model,model_name,deployment_name",
@@ -47,17 +91,34 @@ class Context(BaseModel, Generic[TLLM]):
     @cached_property
     def llm_is_anthropic(self) -> bool:
         """Get base LLM type."""
-        if llm_type := getattr(self.llm, "_llm_type", None):
+        return self.is_anthropic(self.llm)
+
+    def is_anthropic(self, llm: Any) -> bool:
+        """Check if llm instance is an anthropic model, unwrapping bindings (tools, config)."""
+        while (bound := getattr(llm, "bound", None)) is not None:
+            llm = bound
+        if llm_type := getattr(llm, "_llm_type", None):
             return "anthropic" in llm_type
         return False
 
+    @property
+    def compaction_saved(self) -> int:
+        """Get tokens removed from history by compaction."""
+        return self._compaction_saved
+
     @cached_property
     def llm_model(self) -> str:
         """Get base LLM Model."""
-        return next((name for source in self._model_source if (name := getattr(self.llm, source, None))), UNSPECIFIED)
+        return self.model_name(self.llm)
+
+    def model_name(self, llm: Any) -> str:
+        """Get model name of llm instance, unwrapping bindings (tools, config)."""
+        while (bound := getattr(llm, "bound", None)) is not None:
+            llm = bound
+        return next((name for source in self._model_source if (name := getattr(llm, source, None))), UNSPECIFIED)
 
-    def shifted_prompts(self, offset: int | None) -> Iterator[dict[str, Any]]:
-        """Get shifted prompts."""
+    def shifted_prompts(self, offset: int | None, max_tokens: int | None = None) -> Iterator[dict[str, Any]]:
+        """Get shifted prompts, optionally within a token budget."""
         max = len(self.prompts)
         if offset:
             min = max - offset
@@ -65,8 +126,50 @@ class Context(BaseModel, Generic[TLLM]):
         else:
             min = 1
 
+        if max_tokens:
+            min = self.token_window_start(min, max_tokens)
+
         return islice(self.prompts, min, max)
 
+    def count_tokens(self, prompt: dict[str, Any]) -> int:
+        """Count prompt tokens. Override to plug in a model tokenizer."""
+        content = prompt.get("content")
+        if not isinstance(content, str):
+            content = dumps(content, default=str).decode()
+        if tool_calls := prompt.get("tool_calls"):
+            content += dumps(tool_calls, default=str).decode()
+        return ceil(len(content) / CHARS_PER_TOKEN) + 4
+
+    def cached_count_tokens(self, prompt: dict[str, Any]) -> int:
+        """Count prompt tokens, reusing previous count of the same message."""
+        if (cached := self._token_counts.get(id(prompt))) is None or cached[0] is not prompt:
+            cached = self._token_counts[id(prompt)] = (prompt, self.count_tokens(prompt))
+        return cached[1]
+
+    def token_window_start(self, min: int, max_tokens: int) -> int:
+        """Get start of the latest prompts fitting max_tokens.
+
+        Tool responses are kept with their assistant tool call. The latest turn is
+        always kept even if it exceeds the budget.
+        """
+        while min > 1 and self.prompts[min]["role"] == ChatRole.TOOL:
+            min -= 1
+
+        start = len(self.prompts)
+        total = 0
+        while start > min:
+            end = start
+            start -= 1
+            while start > min and self.prompts[start]["role"] == ChatRole.TOOL:
+                start -= 1
+
+            tokens = sum(self.cached_count_tokens(self.prompts[index]) for index in range(start, end))
+            if total and total + tokens > max_tokens:
+                start = end
+                break
+            total += tokens
+        return start
+
     async def start(self, action: type[TAction], /, **kwargs: Any) -> tuple[TAction, ActionResult]:
         """Start Action."""
         if not self.prompts or self.prompts[0]["role"] != ChatRole.SYSTEM:
@@ -75,7 +178,10 @@ class Context(BaseModel, Generic[TLLM]):
         self._action_call.clear()
 
         agent = action(**kwargs)
-        return agent, await agent.execute(self)
+        try:
+            return agent, await agent.execute(self)
+        finally:
+            await self.wait_compaction()
 
     def check_self_recursion(self, action: "Action") -> bool:
         """Check self recursion."""
@@ -130,6 +236,7 @@ class Context(BaseModel, Generic[TLLM]):
         usage: UsageMetadata | None,
         name: str | None = None,
         raise_error: bool = False,
+        tier: str | None = None,
     ) -> None:
         """Add usage."""
         if not usage:
@@ -138,10 +245,203 @@ class Context(BaseModel, Generic[TLLM]):
             return
 
         model = model or UNSPECIFIED
-        action._usage.append({"name": name, "model": model, "usage": usage})
+        data: UsageData = {"name": name, "model": model, "usage": usage}
+        if tier:
+            data["tier"] = tier
+        action._usage.append(data)
 
         await self.merge_to_usages(model, usage)
 
+    def llm_cache_key(self, llm: Any, messages: list[dict[str, Any]]) -> str:
+        """Generate canonical cache key of model, bindings (tools, temperature) and messages."""
+        bindings = []
+        while (bound := getattr(llm, "bound", None)) is not None:
+            bindings.append((getattr(llm, "kwargs", None), getattr(llm, "config", None)))
+            llm = bound
+        return schema_hash(
+            llm.__class__.__qualname__,
+            next((name for source in self._model_source if (name := getattr(llm, source, None))), UNSPECIFIED),
+            getattr(llm, "temperature", None),
+            getattr(llm, "_identifying_params", None),
+            bindings,
+            messages,
+        )
+
+    def semantic_cache_text(self, messages: list[dict[str, Any]], turns: int) -> str:
+        """Get trailing user turns used as semantic cache query."""
+        contents = [
+            content
+            for message in reversed(messages)
+            if message["role"] == ChatRole.USER and isinstance(content := message.get("content"), str)
+        ]
+        return "\n".join(reversed(contents[:turns]))
+
+    async def rate_limited_invoke(self, llm: Any, messages: list[dict[str, Any]], name: str | None = None) -> AIMessage:
+        """Invoke LLM within the rate limit attached to its registry entry.
+
+        Input tokens are estimated with `count_tokens` before the call and corrected
+        with the actual `usage_metadata` afterwards.
+        """
+        if (limiter := LLM.limiter(llm)) is None:
+            return await llm.ainvoke(messages)
+
+        # per call messages are mostly transient, counting them must not grow `_token_counts`
+        estimated = sum(self.count_tokens(message) for message in messages)
+        if wait := await limiter.acquire(estimated):
+            await self.notify(
+                {
+                    "event": "llm",
+                    "type": "rate-limit",
+                    "status": "completed",
+                    "data": {"name": name or UNSPECIFIED, "wait": wait, "waiting": limiter.waiting},
+                }
+            )
+
+        actual = estimated
+        try:
+            message = await llm.ainvoke(messages)
+            if message.usage_metadata:
+                actual = message.usage_metadata["total_tokens"]
+            return message
+        finally:
+            limiter.reconcile(estimated, actual)
+
+    async def hedged_invoke(
+        self,
+        action: "Action",
+        llm: Any,
+        messages: list[dict[str, Any]],
+        name: str | None = None,
+    ) -> tuple[AIMessage, Any]:
+        """Invoke LLM, duplicating slow calls to an alternate registry entry.
+
+        Applies when the action sets `__hedge__` or the registry entry has a `Hedge`
+        policy. Once the call exceeds the tracked latency percentile, it is sent to
+        the alternate too, unless it is not registered. The first response wins and
+        the other call is cancelled.
+        Tokens of the losing call are recorded under `$hedge` and its own model.
+        Returns the response with the llm that answered.
+        """
+        if (key := LLM.key(llm)) is None or ((hedge := LLM.__hedges__.get(key)) is None and not action.__hedge__):
+            return await self.rate_limited_invoke(llm, messages, name), llm
+
+        if hedge is None:
+            hedge = LLM.hedge(key)
+
+        started = perf_counter()
+        alternate = action.__hedge__ or hedge.alternate
+        if (
+            not alternate
+            or alternate == key
+            or (alternate_llm := LLM.get(alternate)) is None
+            or (delay := hedge.delay(action.__hedge_percentile__)) is None
+        ):
+            message = await self.rate_limited_invoke(llm, messages, name)
+            hedge.record(perf_counter() - started)
+            return message, llm
+
+        primary = create_task(self.rate_limited_invoke(llm, messages, name))
+        llms = {primary: llm}
+        try:
+            pending: set[Task[AIMessage]] = set(llms)
+            if not (await wait(pending, timeout=delay))[0]:
+                hedge.hedged += 1
+                secondary_llm = LLM.rebind(llm, alternate_llm)
+                secondary = create_task(self.rate_limited_invoke(secondary_llm, messages, "$hedge"))
+                llms[secondary] = secondary_llm
+                pending.add(secondary)
+                await self.notify(
+                    {
+                        "event": "llm",
+                        "type": "hedge",
+                        "status": "started",
+                        "data": {"name": name or UNSPECIFIED, "alternate": alternate, "delay": delay},
+                    }
+                )
+
+            winner = None
+            while pending and winner is None:
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+
+            hedge.record(perf_counter() - started)
+            if winner is not None and winner is not primary:
+                hedge.won += 1
+
+            for task, task_llm in llms.items():
+                if task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                    estimated = sum(self.count_tokens(message) for message in messages)
+                    usage: UsageMetadata = {"input_tokens": estimated, "output_tokens": 0, "total_tokens": estimated}
+                    await self.add_usage(action, self.model_name(task_llm), usage, "$hedge")
+                elif task.exception() is None:
+                    await self.add_usage(action, self.model_name(task_llm), task.result().usage_metadata, "$hedge")
+
+            winner = winner or primary
+            return winner.result(), llms[winner]
+        finally:
+            for task in llms:
+                task.cancel()
+
+    async def invoke_llm(
+        self,
+        action: "Action",
+        llm: Any,
+        messages: list[dict[str, Any]],
+        name: str | None = None,
+        semantic_threshold: float | None = None,
+        tier: str | None = None,
+    ) -> AIMessage:
+        """Invoke LLM and record its usage.
+
+        Single entry point of action LLM calls. Responses are served from `LLM_CACHE`
+        when the action enables `__llm_cache__`, then from `SEMANTIC_CACHE` when a
+        similarity threshold is given and an embedding LLM is registered. Identical
+        concurrent calls share one request when `__llm_single_flight__` is enabled.
+        Hits and shared calls are recorded as zero usage. Remaining calls queue on
+        the rate limit of their registry entry. `tier` is recorded with the usage.
+        """
+        model = self.model_name(llm)
+        key = self.llm_cache_key(llm, messages) if action.__llm_cache__ or action.__llm_single_flight__ else None
+        if key and action.__llm_cache__ and (cached := await LLM_CACHE.get(key)) is not None:
+            await self.add_usage(action, model, ZERO_USAGE, name, tier=tier)
+            return AIMessage(**cached)
+
+        semantic: tuple[Any, Hashable, Any] | None = None
+        # only fresh user turns; later iterations (tool responses after it) must reach the LLM
+        if semantic_threshold is not None and messages and messages[-1]["role"] == ChatRole.USER:
+            from .semantic import SEMANTIC_CACHE, VectorIndex
+
+            if (embedding := LLM.get(SEMANTIC_CACHE.embedding)) is not None and (
+                text := self.semantic_cache_text(messages, SEMANTIC_CACHE.turns)
+            ):
+                scope = (action.__class__, self.llm_cache_key(llm, []))
+                vector = VectorIndex.normalize(await embedding.aembed_query(text))
+                if (cached := SEMANTIC_CACHE.get(scope, vector, semantic_threshold)) is not None:
+                    await self.add_usage(action, model, ZERO_USAGE, name, tier=tier)
+                    return AIMessage(**cached)
+                semantic = (SEMANTIC_CACHE, scope, vector)
+
+        if key and action.__llm_single_flight__:
+            (message, answered), shared = await LLM_SINGLE_FLIGHT.do(
+                key, partial(self.hedged_invoke, action, llm, messages, name)
+            )
+            if shared:
+                self._shared_calls[name or UNSPECIFIED] = self._shared_calls.get(name or UNSPECIFIED, 0) + 1
+                await self.add_usage(action, model, ZERO_USAGE, name, tier=tier)
+                return message.model_copy()
+        else:
+            message, answered = await self.hedged_invoke(action, llm, messages, name)
+
+        await self.add_usage(action, self.model_name(answered), message.usage_metadata, name, tier=tier)
+        if key and action.__llm_cache__:
+            await LLM_CACHE.set(key, message.model_dump(), action.__llm_cache_ttl__)
+        if semantic and message.tool_calls:
+            semantic[0].set(semantic[1], semantic[2], message.model_dump())
+        return message
+
     async def add_message(self, role: ChatRole, content: str, metadata: dict[str, Any] | None = None) -> None:
         """Add message."""
         self.prompts.append({"content": content, "role": role})
@@ -243,27 +543,112 @@ class Context(BaseModel, Generic[TLLM]):
 
         self.metadata = value
 
+    def prompts_tokens(self) -> int:
+        """Count tokens of all prompts."""
+        return sum(self.cached_count_tokens(prompt) for prompt in self.prompts)
+
+    def compact(self) -> Task[None] | None:
+        """Start background compaction once prompts exceed the threshold."""
+        if (
+            not self._compaction_threshold
+            or (self._compaction and not self._compaction.done())
+            or self.prompts_tokens() <= self._compaction_threshold
+        ):
+            return None
+
+        self._compaction = get_running_loop().create_task(self.compaction())
+        return self._compaction
+
+    async def wait_compaction(self) -> None:
+        """Wait for pending background compaction."""
+        if self._compaction and not self._compaction.done():
+            await self._compaction
+
+    def compaction_transcript(self, prompts: list[dict[str, Any]]) -> str:
+        """Render prompts as plain transcript for the compaction LLM."""
+        lines = []
+        for prompt in prompts:
+            line = f"{prompt['role']}: {prompt.get('content') or ''}"
+            if tool_calls := prompt.get("tool_calls"):
+                line += f"\ntool_calls: {dumps(tool_calls, default=str).decode()}"
+            lines.append(line)
+        return "\n\n".join(lines)
+
+    async def compaction(self) -> None:
+        """Summarize older prompts and replace them with a summary message.
+
+        Keeps the system message and the latest `_compaction_keep_tokens` worth of turns.
+        Tokens removed from history are counted in `compaction_saved`.
+        """
+        end = self.token_window_start(1, self._compaction_keep_tokens)
+        compacted = self.prompts[1:end]
+        if len(compacted) < 2:
+            return
+
+        llm: Any = LLM.get(self._compaction_llm) or self.llm
+        model = self.model_name(llm)
+        try:
+            message = await self.rate_limited_invoke(
+                llm,
+                [
+                    {"content": DEFAULT_COMPACTION_PROMPT, "role": ChatRole.SYSTEM},
+                    {
+                        "content": self.compaction_transcript(compacted),
+                        "role": ChatRole.USER,
+                    },
+                ],
+                "$compaction",
+            )
+        except Exception as exception:
+            await self.notify({"event": "compaction", "status": "failed", "data": {"error": str(exception)}})
+            return
+
+        if message.usage_metadata:
+            await self.merge_to_usages(model, message.usage_metadata)
+
+        if len(self.prompts) < end or any(
+            old is not new for old, new in zip(compacted, self.prompts[1:end], strict=True)
+        ):
+            return
+
+        # anthropic only accepts a leading system message
+        summary = {
+            "content": f"Summary of earlier conversation:\n{message.text}",
+            "role": ChatRole.ASSISTANT if self.llm_is_anthropic else ChatRole.SYSTEM,
+        }
+        saved = sum(self.cached_count_tokens(prompt) for prompt in compacted) - self.cached_count_tokens(summary)
+        self.prompts[1:end] = [summary]
+        for prompt in compacted:
+            self._token_counts.pop(id(prompt), None)
+        if saved > 0:
+            self._compaction_saved += saved
+
+        await self.notify(
+            {"event": "compaction", "status": "completed", "data": {"messages": len(compacted), "saved": saved}}
+        )
+
     async def notify(self, message: dict[str, Any]) -> None:
         """Notify Client."""
         pass
 
     def run_new_event_loop(self, task: Coroutine[Any, Any, T]) -> T:
         """Run concurrent on different thread."""
-        loop = new_event_loop()
-        try:
-            return loop.run_until_complete(task)
-        except Exception:
-            raise
-        finally:
-            loop.close()
+        with Runner() as runner:
+            # cancels leftover tasks (e.g. background compaction) before closing the loop
+            return runner.run(task)
 
     def run_task_in_thread(
         self,
         task: Coroutine[Any, Any, T],
-        executor: Executor | None = None,
+        executor: Executor | LoopPool | None = None,
     ) -> Future[T]:
-        """Run task on different thread."""
-        return get_event_loop().run_in_executor(executor, self.run_new_event_loop, task)
+        """Run task on different thread.
+
+        Defaults to the shared `LoopPool`. An `Executor` runs the task on a new event loop per call.
+        """
+        if isinstance(executor, Executor):
+            return get_event_loop().run_in_executor(executor, self.run_new_event_loop, task)
+        return wrap_future((executor or LoopPool.get()).submit(task))
 
     def run_func_in_thread(
         self,
@@ -275,16 +660,36 @@ class Context(BaseModel, Generic[TLLM]):
         """Run func on different thread."""
         return get_event_loop().run_in_executor(executor, partial(task, *args, **kwargs))
 
+    def run_func_in_process(
+        self,
+        task: Callable[P, T],
+        executor: Executor | None = None,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[T]:
+        """Run picklable func on worker process."""
+        return get_event_loop().run_in_executor(executor or process_executor(), partial(task, *args, **kwargs))
+
     async def detach_context(self: TContext) -> TContext:
         """Spawn detached context."""
-        return self.__class__(**self.detached_kwargs(), parent=self)
+        return self.__class__.model_construct(**self.detached_kwargs(), parent=self)
+
+    def share(self, name: str) -> CowDict:
+        """Share dict field copy-on-write."""
+        if not isinstance(value := getattr(self, name), CowDict):
+            value = CowDict(value)
+            setattr(self, name, value)
+        return value.share()
 
     def detached_kwargs(self, **kwargs: Any) -> dict[str, Any]:
-        """Retrieve detached kwargs."""
+        """Retrieve detached kwargs.
+
+        Prompts are shared per message and dict fields are shared copy-on-write.
+        """
         return {
-            "prompts": deepcopy(self.prompts),
-            "allowed_actions": deepcopy(self.allowed_actions),
-            "metadata": deepcopy(self.metadata),
+            "prompts": list(self.prompts),
+            "allowed_actions": dict(self.allowed_actions),
+            "metadata": self.share("metadata"),
             "streaming": self.streaming,
             "max_self_recursion": self.max_self_recursion,
             **kwargs,
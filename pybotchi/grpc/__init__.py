@@ -3,11 +3,14 @@
 from sys import argv
 
 try:
-    from .action import GRPCAction, GRPCRemoteAction, graph
+    from .action import GRPC_ACTION_CATALOG, GRPC_ACTION_REGISTRY, GRPCAction, GRPCRemoteAction, graph
     from .common import GRPCConfig, GRPCConnection, GRPCIntegration
     from .context import GRPCContext
+    from .pool import GRPCChannelPool
 
     __all__ = [
+        "GRPC_ACTION_REGISTRY",
+        "GRPC_ACTION_CATALOG",
         "GRPCAction",
         "GRPCRemoteAction",
         "graph",
@@ -15,6 +18,7 @@ try:
         "GRPCConnection",
         "GRPCIntegration",
         "GRPCContext",
+        "GRPCChannelPool",
     ]
 except TypeError:
     if not any(arg.endswith("pybotchi-grpc-compile") for arg in argv):
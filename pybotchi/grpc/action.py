@@ -1,28 +1,24 @@
 """Pybotchi GRPC Classes."""
 
 from asyncio import Queue
-from collections.abc import AsyncGenerator, AsyncIterator, Awaitable
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Hashable
 from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
 from inspect import getmembers
 from itertools import islice
+from os import getenv
 from typing import Any, Generic
 
-from datamodel_code_generator import DataModelType, Formatter, PythonVersion
-from datamodel_code_generator.model import DataModelSet, get_data_model_types
-from datamodel_code_generator.parser.jsonschema import (
-    JsonSchemaParser,
-)
 from google.protobuf.json_format import MessageToDict
-from grpc import Compression, ssl_channel_credentials
-from grpc.aio import insecure_channel, secure_channel
-from orjson import dumps
 
-from ..action import Action, ChildActions
+from ..action import Action, ActionClasses, ActionStub, ChildActions, materialize
+from ..cache import ActionRegistry, LRUCache, schema_hash
 from ..common import ActionResult, ActionReturn, Graph
-from ..utils import unwrap_exceptions
+from ..schema import build_model
 from .common import GRPCConfigLoaded, GRPCConnection, GRPCIntegration
 from .context import TContext
 from .exception import GRPCRemoteError
+from .pool import GRPCChannelPool
 from .pybotchi_pb2 import (
     ActionListRequest,
     ActionListResponse,
@@ -33,9 +29,11 @@ from .pybotchi_pb2 import (
 )
 from .pybotchi_pb2_grpc import PyBotchiGRPCStub
 
-DMT: DataModelSet = get_data_model_types(
-    DataModelType.PydanticV2BaseModel,
-    target_python_version=PythonVersion.PY_313,
+GRPC_ACTION_REGISTRY: "ActionRegistry[GRPCRemoteAction]" = ActionRegistry(
+    int(getenv("GRPC_ACTION_REGISTRY_SIZE", "1024"))
+)
+GRPC_ACTION_CATALOG: LRUCache[Hashable, tuple[ActionListResponse, dict[str, dict[str, Any]]]] = LRUCache(
+    int(getenv("GRPC_ACTION_CATALOG_SIZE", "256"))
 )
 
 
@@ -63,28 +61,49 @@ class GRPCClient:
         self.block_return = block_return
         self.exclude_unset = exclude_unset
 
-    def build_action(self, agent_id: str, action_schema: ActionSchema) -> tuple[str, type["GRPCRemoteAction"]]:
-        """Build GRPCToolAction."""
-        globals: dict[str, Any] = {}
+    def build_action(
+        self,
+        agent_id: str,
+        action_schema: ActionSchema,
+        patch: type[Action] | None = None,
+        version: str = "",
+    ) -> tuple[str, type["GRPCRemoteAction"]]:
+        """Build GRPCToolAction.
+
+        Versioned catalogs are keyed by server version instead of the serialized schema.
+        """
         schema = action_schema.schema
         class_name = schema.title
-        exec(
-            JsonSchemaParser(
-                dumps(MessageToDict(schema)).decode(),
-                data_model_type=DMT.data_model,
-                data_model_root_type=DMT.root_model,
-                data_model_field_type=DMT.field_model,
-                data_type_manager_type=DMT.data_type_manager,
-                dump_resolve_reference_action=DMT.dump_resolve_reference_action,
-                class_name=class_name,
-                strict_nullable=True,
-                formatters=[Formatter.RUFF_FORMAT, Formatter.RUFF_CHECK],
-            )
-            .parse()
-            .removeprefix("from __future__ import annotations"),  # type: ignore[union-attr]
-            globals,
+        key = (
+            self.name,
+            class_name,
+            schema_hash(
+                agent_id,
+                (
+                    (version, action_schema.group)
+                    if version
+                    else action_schema.SerializeToString(deterministic=True).hex()
+                ),
+                self.exclude_unset,
+                self.block_return,
+            ),
+            self.remote_action_class,
+            patch,
         )
-        base_class = globals[class_name]
+        if action := GRPC_ACTION_REGISTRY.get(key):
+            return class_name, action
+
+        if patch is not None:
+            _, base_action = self.build_action(agent_id, action_schema, version=version)
+            action = type(
+                class_name,
+                (patch, base_action),
+                {"__module__": f"{base_action.__module__}.patched"},
+            )
+            GRPC_ACTION_REGISTRY.set(key, action)
+            return class_name, action
+
+        base_class = build_model(MessageToDict(schema), class_name, self.remote_action_class)
 
         concurrent = action_schema.concurrent
         if self.remote_action_class is not GRPCRemoteAction:
@@ -102,7 +121,7 @@ class GRPCClient:
                 self.remote_action_class,
             ),
             {
-                "__grpc_client__": self,
+                "__grpc_connection__": self.name,
                 "__grpc_group__": action_schema.group,
                 "__grpc_action_name__": schema.title,
                 "__grpc_exclude_unset__": self.exclude_unset,
@@ -115,30 +134,62 @@ class GRPCClient:
         if desc := schema.description:
             action.__doc__ = desc
 
+        GRPC_ACTION_REGISTRY.set(key, action)
         return class_name, action
 
-    async def patch_actions(self, actions: ChildActions, grpc_actions: ChildActions) -> ChildActions:
-        """Retrieve Tools."""
+    def materialize(self, agent_id: str, action_schema: ActionSchema, version: str) -> type["GRPCRemoteAction"]:
+        """Build unpatched GRPCRemoteAction class."""
+        return self.build_action(agent_id, action_schema, version=version)[1]
+
+    async def patch_actions(
+        self, actions: ChildActions, grpc_actions: ActionClasses, stub: bool = True
+    ) -> ChildActions:
+        """Retrieve Tools.
+
+        Disallowed actions are skipped before their classes are built. Unpatched actions
+        are added as `ActionStub` unless `stub` is disabled. The last catalog is cached
+        and revalidated by version so unchanged servers answer with `not_modified`.
+        """
+        allowed_actions = None if self.manual_enable else self.allowed_actions
+        key = (
+            self.config["url"],
+            tuple(self.config["groups"]),
+            None if allowed_actions is None else tuple(sorted(allowed_actions.items())),
+        )
+        cached = GRPC_ACTION_CATALOG.get(key)
         response: ActionListResponse = await self.stub.action_list(
             ActionListRequest(
                 groups=self.config["groups"],
-                allowed_actions=None if self.manual_enable else self.allowed_actions,
+                allowed_actions=allowed_actions,
+                version=cached[0].version if cached else "",
             )
         )
+        if response.not_modified and cached:
+            response, schemas = cached
+        else:
+            schemas = {
+                action_schema.schema.title: MessageToDict(action_schema.schema) for action_schema in response.actions
+            }
+            if response.version:
+                GRPC_ACTION_CATALOG.set(key, (response, schemas))
 
         for action_schema in response.actions:
-            name, action = self.build_action(response.agent_id, action_schema)
-            if _tool := grpc_actions.get(name):
-                action = type(
+            name = action_schema.schema.title
+            patch = grpc_actions.get(name)
+            if self.allowed_actions and not self.allowed_actions.get(
+                name, False if self.manual_enable else (patch or self.remote_action_class).__enabled__
+            ):
+                continue
+
+            if stub and patch is None and not self.remote_action_class.__has_as_tool__:
+                actions[name] = ActionStub(
                     name,
-                    (_tool, action),
-                    {"__module__": f"{action.__module__}.patched"},
+                    action_schema.schema.description,
+                    schemas[name],
+                    partial(self.materialize, response.agent_id, action_schema, response.version),
                 )
-
-            if not self.allowed_actions or self.allowed_actions.get(
-                name, False if self.manual_enable else action.__enabled__
-            ):
-                actions[name] = action
+            else:
+                actions[name] = self.build_action(response.agent_id, action_schema, patch, response.version)[1]
 
         return actions
 
@@ -148,7 +199,7 @@ class GRPCAction(Action[TContext]):
 
     __grpc_clients__: dict[str, GRPCClient]
     __grpc_connections__: list[GRPCConnection]
-    __grpc_tool_actions__: ChildActions
+    __grpc_tool_actions__: ActionClasses
 
     # --------------------- not inheritable -------------------- #
 
@@ -175,70 +226,14 @@ class GRPCAction(Action[TContext]):
     async def pre_grpc(self, context: TContext) -> ActionResult:
         """Execute pre grpc process."""
 
-    async def execute(self, context: TContext, parent: Action | None = None, append: bool = True) -> ActionResult:
-        """Execute main process."""
-        self._parent = parent
-
-        result = None
-        parent_context = context
-        try:
-            if parent and append:
-                parent._actions.append(self)
-
-            if self.__detached__:
-                context = await context.detach_context()
-
-            if context.check_self_recursion(self):
-                return ActionReturn.STOP
-
-            if self.__has_pre_grpc__ and (result := await self.pre_grpc(context)) and result.is_end:
-                return result
-
-            async with multi_grpc_clients(context.integrations, self.__grpc_connections__) as clients:
-                self.__grpc_clients__ = clients
-
-                if self.__has_pre__ and (result := await self.pre(context)) and result.is_end:
-                    return result
-
-                if self.__max_iteration__:
-                    iteration = 0
-                    while iteration < self.__max_iteration__:
-                        if (result := await self.execution(context)) and result.is_break:
-                            break
-                        iteration += 1
-                    if (
-                        result
-                        and result.is_stop
-                        or (
-                            iteration >= self.__max_iteration__
-                            and (result := await self.on_max_iteration(context))
-                            and result.is_end
-                        )
-                    ):
-                        return result
-                elif (result := await self.execution(context)) and result.is_end:
-                    return result
-
-                if self.__has_post__ and (result := await self.post(context)) and result.is_end:
-                    return result
-
-                return result
-        except Exception as exception:
-            if not self.__has_on_error__:
-                self.__to_commit__ = False
-                raise next(unwrap_exceptions(exception)) from None
-            elif (
-                result := await self.on_error(
-                    context,
-                    exception,
-                    unwrap_exceptions(exception),
-                )
-            ) and result.is_end:
-                return result
+    async def execute_lifecycle(self, context: TContext) -> ActionResult:
+        """Execute pre grpc then the lifecycle within gRPC client sessions."""
+        if self.__has_pre_grpc__ and (result := await self.pre_grpc(context)) and result.is_end:
             return result
-        finally:
-            if self.__to_commit__ and self.__detached__:
-                await self.commit_context(parent_context, context)
+
+        async with multi_grpc_clients(context.integrations, self.__grpc_connections__) as clients:
+            self.__grpc_clients__ = clients
+            return await super().execute_lifecycle(context)
 
     async def get_child_actions(self, context: TContext) -> ChildActions:
         """Retrieve child Actions."""
@@ -285,13 +280,25 @@ class GRPCRemoteAction(Action[TContext], Generic[TContext]):
     __grpc_action__ = True
     __grpc_return__: ActionResult = None
 
-    __grpc_client__: GRPCClient
+    __grpc_connection__: str
     __grpc_group__: str
     __grpc_action_name__: str
     __grpc_exclude_unset__: bool
     __grpc_queue__: Queue[Event]
     __grpc_block_return__: bool
 
+    @property
+    def __grpc_client__(self) -> GRPCClient:
+        """Resolve GRPC client from the nearest parent GRPCAction."""
+        parent = self._parent
+        while parent is not None:
+            if (clients := getattr(parent, "__grpc_clients__", None)) and (
+                client := clients.get(self.__grpc_connection__)
+            ):
+                return client
+            parent = parent._parent
+        raise RuntimeError(f"GRPC client `{self.__grpc_connection__}` is not available!")
+
     async def grpc_event_close(self, context: TContext, event: Event) -> None:
         """Consume close event."""
         if not (data := MessageToDict(event)["data"]):
@@ -413,7 +420,7 @@ class GRPCRemoteAction(Action[TContext], Generic[TContext]):
 
     async def pre(self, context: TContext) -> ActionResult:
         """Execute pre process."""
-        action_args = self.model_dump(exclude_unset=self.__grpc_exclude_unset__)
+        action_args = self.model_dump(exclude_unset=self.__grpc_exclude_unset__, by_alias=True)
 
         await context.notify(
             {
@@ -458,6 +465,7 @@ async def multi_grpc_clients(
 ) -> AsyncIterator[dict[str, GRPCClient]]:
     """Connect to multiple grpc clients."""
     async with AsyncExitStack() as stack:
+        pool = GRPCChannelPool.get()
         clients: dict[str, GRPCClient] = {}
         for conn in connections:
             integration: GRPCIntegration | None = integrations.get(conn.name)
@@ -475,31 +483,11 @@ async def multi_grpc_clients(
             else:
                 allowed_actions = conn.allowed_actions
 
-            if overrided_config.get("secure"):
-                channel = await stack.enter_async_context(
-                    secure_channel(
-                        target=overrided_config["url"],
-                        credentials=ssl_channel_credentials(
-                            root_certificates=overrided_config["root_certificates"],
-                            private_key=overrided_config["private_key"],
-                            certificate_chain=overrided_config["certificate_chain"],
-                        ),
-                        options=overrided_config["options"],
-                        compression=(Compression[comp] if (comp := overrided_config["compression"]) else None),
-                        interceptors=conn.interceptors,
-                    )
-                )
-            else:
-                channel = await stack.enter_async_context(
-                    insecure_channel(
-                        target=overrided_config["url"],
-                        options=overrided_config["options"],
-                        compression=(Compression[comp] if (comp := overrided_config["compression"]) else None),
-                        interceptors=conn.interceptors,
-                    )
-                )
+            entry = await pool.acquire(overrided_config, conn.interceptors, integration.get("pooled", conn.pooled))
+            stack.push_async_callback(pool.release, entry)
+
             clients[conn.name] = GRPCClient(
-                PyBotchiGRPCStub(channel),
+                entry.stub,
                 conn.name,
                 overrided_config,
                 conn.manual_enable,
@@ -554,6 +542,7 @@ async def traverse(
     """Retrieve Graph."""
     current = f"{alias or action.__module__}.{action.__qualname__}"
 
+    child_actions: ChildActions
     if allowed_actions:
         child_actions = {
             name: child
@@ -561,16 +550,20 @@ async def traverse(
             if allowed_actions.get(name, child.__enabled__)
         }
     else:
-        child_actions = action.__child_actions__.copy()
+        child_actions = {**action.__child_actions__}
 
     async with AsyncExitStack() as stack:
+        clients: dict[str, GRPCClient] = {}
         if issubclass(action, GRPCAction):
             clients = await stack.enter_async_context(
                 multi_grpc_clients(integrations, action.__grpc_connections__, bypass)
             )
-            [await client.patch_actions(child_actions, action.__grpc_tool_actions__) for client in clients.values()]
+            [
+                await client.patch_actions(child_actions, action.__grpc_tool_actions__, False)
+                for client in clients.values()
+            ]
 
-        for child_action in child_actions.values():
+        for child_action in materialize(child_actions).values():
             child = (
                 f"{alias or child_action.__module__}.{child_action.__qualname__}"
                 if child_action.__module__ == module
@@ -581,18 +574,19 @@ async def traverse(
                     current,
                     child,
                     child_action.__concurrent__,
-                    (child_action.__grpc_client__.name if issubclass(child_action, GRPCRemoteAction) else ""),
+                    (child_action.__grpc_connection__ if issubclass(child_action, GRPCRemoteAction) else ""),
                 )
             )
 
             if child not in graph.nodes:
                 graph.nodes.add(child)
                 if issubclass(child_action, GRPCRemoteAction):
-                    response: TraverseGraph = await child_action.__grpc_client__.stub.traverse(
+                    client = clients[child_action.__grpc_connection__]
+                    response: TraverseGraph = await client.stub.traverse(
                         TraverseRequest(
                             nodes=list(graph.nodes),
                             alias=child_action.__module__,
-                            groups=child_action.__grpc_client__.config["groups"],
+                            groups=client.config["groups"],
                             name=child_action.__grpc_action_name__,
                             integrations=integrations,
                         )
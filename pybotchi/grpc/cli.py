@@ -39,6 +39,10 @@ async def serve(
     server = grpc_server(
         options=[
             ("grpc.so_reuseport", 1),
+            # accept keepalive pings of pooled client channels
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.min_recv_ping_interval_without_data_ms", int(getenv("GRPC_KEEPALIVE_TIME_MS", "30000"))),
+            ("grpc.http2.max_ping_strikes", 0),
         ]
     )
     target_path = Path(path).resolve()
@@ -55,6 +55,7 @@ class GRPCIntegration(TypedDict, total=False):
     config: GRPCConfig
     allowed_actions: dict[str, bool]
     exclude_unset: bool
+    pooled: bool
 
 
 class GRPCConnection:
@@ -80,6 +81,7 @@ class GRPCConnection:
         block_return: bool = False,
         exclude_unset: bool = True,
         require_integration: bool = True,
+        pooled: bool = True,
     ) -> None:
         """Build GRPC Connection."""
         self.name = name
@@ -100,6 +102,7 @@ class GRPCConnection:
         self.block_return = block_return
         self.exclude_unset = exclude_unset
         self.require_integration = require_integration
+        self.pooled = pooled
 
     async def get_config(self, override: GRPCConfig | None) -> GRPCConfigLoaded:
         """Generate config."""
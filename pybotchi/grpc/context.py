@@ -1,7 +1,6 @@
 """Pybotchi GRPC Context."""
 
 from asyncio import Queue
-from copy import deepcopy
 from typing import Any, TypeVar
 
 from pydantic import Field, PrivateAttr
@@ -64,7 +63,7 @@ class GRPCContext(Context[TLLM]):
 
     def detached_kwargs(self, **kwargs: Any) -> dict[str, Any]:
         """Retrieve detached kwargs."""
-        return super().detached_kwargs(integrations=deepcopy(self.integrations))
+        return super().detached_kwargs(integrations=self.share("integrations"), **kwargs)
 
     async def add_message(
         self,
@@ -12,6 +12,7 @@ from grpc import StatusCode
 from grpc.aio import Metadata, ServicerContext, UsageError
 
 from ..action import Action
+from ..cache import schema_hash
 from ..common import Graph, Stop
 from ..utils import uuid
 from .action import traverse
@@ -42,6 +43,26 @@ class PyBotchiGRPC(PyBotchiGRPCServicer, Generic[TContext]):
         self.module = module
         self.groups = groups
         self.__has_validate_metadata__ = self.__class__.validate_metadata is not PyBotchiGRPC.validate_metadata
+        self.build_action_schemas()
+
+    def build_action_schemas(self) -> None:
+        """Precompute action schemas and catalog version."""
+        schemas: dict[type[Action], JSONSchema] = {}
+        self.action_schemas: dict[str, dict[type[Action], ActionSchema]] = {}
+        for group, actions in self.groups.items():
+            action_schemas = self.action_schemas[group] = {}
+            for action in actions.values():
+                if (schema := schemas.get(action)) is None:
+                    schema = schemas[action] = JSONSchema(**action.model_json_schema())
+                action_schemas[action] = ActionSchema(concurrent=action.__concurrent__, group=group, schema=schema)
+
+        self.version = schema_hash(
+            [
+                (group, action.__name__, action.__enabled__, action_schema.SerializeToString(deterministic=True).hex())
+                for group, action_schemas in sorted(self.action_schemas.items())
+                for action, action_schema in action_schemas.items()
+            ]
+        )
 
     async def validate_metadata(self, metadata: Metadata | None) -> None:
         """Validate invocation metadata."""
@@ -188,30 +209,21 @@ class PyBotchiGRPC(PyBotchiGRPCServicer, Generic[TContext]):
         if self.__has_validate_metadata__ and self.validate_metadata(context.invocation_metadata()):
             await context.abort(StatusCode.FAILED_PRECONDITION)
 
-        actions: dict[type[Action], str] = {}
+        if request.version == self.version:
+            return ActionListResponse(agent_id=self.id, version=self.version, not_modified=True)
+
+        actions: dict[type[Action], ActionSchema] = {}
         for group in request.groups:
-            if not (action_group := self.groups.get(group)):
+            if not (action_group := self.action_schemas.get(group)):
                 continue
 
-            for action in action_group.values():
+            for action, action_schema in action_group.items():
                 if (
                     not request.allowed_actions or request.allowed_actions.get(action.__name__, action.__enabled__)
                 ) and action not in actions:
-                    actions[action] = group
-
-        return ActionListResponse(
-            agent_id=self.id,
-            actions=(
-                [
-                    ActionSchema(
-                        concurrent=action.__concurrent__,
-                        group=group,
-                        schema=JSONSchema(**action.model_json_schema()),
-                    )
-                    for action, group in actions.items()
-                ]
-            ),
-        )
+                    actions[action] = action_schema
+
+        return ActionListResponse(agent_id=self.id, actions=actions.values(), version=self.version)
 
     async def traverse(self, request: TraverseRequest, context: ServicerContext) -> TraverseGraph:
         """Consume `action_list` method."""
@@ -0,0 +1,187 @@
+"""Pybotchi GRPC Channel Pool."""
+
+from asyncio import AbstractEventLoop, get_running_loop
+from collections.abc import Hashable, Sequence
+from contextlib import suppress
+from os import getenv
+from time import monotonic
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
+
+from grpc import ChannelConnectivity, Compression, ssl_channel_credentials
+from grpc.aio import Channel, ClientInterceptor, insecure_channel, secure_channel
+
+from ..cache import schema_hash
+from .common import GRPCConfigLoaded
+from .pybotchi_pb2_grpc import PyBotchiGRPCStub
+
+KEEPALIVE_OPTIONS: dict[str, Any] = {
+    "grpc.keepalive_time_ms": int(getenv("GRPC_KEEPALIVE_TIME_MS", "30000")),
+    "grpc.keepalive_timeout_ms": int(getenv("GRPC_KEEPALIVE_TIMEOUT_MS", "10000")),
+    "grpc.keepalive_permit_without_calls": int(getenv("GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS", "0")),
+    "grpc.http2.max_pings_without_data": 0,
+}
+
+UNHEALTHY_STATES = {ChannelConnectivity.TRANSIENT_FAILURE, ChannelConnectivity.SHUTDOWN}
+
+
+def channel_key(config: GRPCConfigLoaded, interceptors: Sequence[ClientInterceptor] | None) -> Hashable:
+    """Generate pool key from effective config."""
+    return (
+        config["url"],
+        config["secure"],
+        config["root_certificates"],
+        config["private_key"],
+        config["certificate_chain"],
+        schema_hash(config["options"]),
+        config["compression"],
+        id(interceptors),
+    )
+
+
+def open_channel(config: GRPCConfigLoaded, interceptors: Sequence[ClientInterceptor] | None) -> Channel:
+    """Open channel with keepalive defaults."""
+    options = list((KEEPALIVE_OPTIONS | dict(config["options"] or ())).items())
+    compression = Compression[comp] if (comp := config["compression"]) else None
+    if config["secure"]:
+        return secure_channel(
+            target=config["url"],
+            credentials=ssl_channel_credentials(
+                root_certificates=config["root_certificates"],
+                private_key=config["private_key"],
+                certificate_chain=config["certificate_chain"],
+            ),
+            options=options,
+            compression=compression,
+            interceptors=interceptors,
+        )
+    return insecure_channel(
+        target=config["url"],
+        options=options,
+        compression=compression,
+        interceptors=interceptors,
+    )
+
+
+class GRPCPooledChannel:
+    """GRPC channel with its cached stub."""
+
+    def __init__(self, key: Hashable, channel: Channel, pooled: bool) -> None:
+        """Initialize pooled channel."""
+        self.key = key
+        self.channel = channel
+        self.stub = PyBotchiGRPCStub(channel)
+        self.pooled = pooled
+        self.borrowed = 0
+        self.last_used = monotonic()
+
+    @property
+    def state(self) -> ChannelConnectivity:
+        """Get current connectivity state without triggering a connection."""
+        return self.channel.get_state(try_to_connect=False)
+
+    async def close(self) -> None:
+        """Close channel."""
+        with suppress(Exception):
+            await self.channel.close()
+
+
+class GRPCChannelPool:
+    """Process level GRPC channel pool.
+
+    One pool per event loop. Channels are keyed by url, credentials, options,
+    compression and interceptors and shared by concurrent borrowers since HTTP/2
+    multiplexes calls per channel.
+    """
+
+    __max_idle__: int = int(getenv("GRPC_POOL_MAX_IDLE", "32"))
+    __idle_timeout__: float = float(getenv("GRPC_POOL_IDLE_TIMEOUT", "300"))
+
+    __pools__: ClassVar[WeakKeyDictionary[AbstractEventLoop, "GRPCChannelPool"]] = WeakKeyDictionary()
+
+    def __init__(self) -> None:
+        """Initialize pool."""
+        self.channels: dict[Hashable, GRPCPooledChannel] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reconnects = 0
+
+    @classmethod
+    def get(cls) -> "GRPCChannelPool":
+        """Get pool of the running event loop."""
+        loop = get_running_loop()
+        if (pool := cls.__pools__.get(loop)) is None:
+            pool = cls.__pools__[loop] = cls()
+        return pool
+
+    async def acquire(
+        self,
+        config: GRPCConfigLoaded,
+        interceptors: Sequence[ClientInterceptor] | None,
+        pooled: bool = True,
+    ) -> GRPCPooledChannel:
+        """Borrow channel."""
+        key = channel_key(config, interceptors)
+        if not pooled:
+            entry = GRPCPooledChannel(key, open_channel(config, interceptors), False)
+        elif (stale := self.channels.get(key)) is not None and stale.state not in UNHEALTHY_STATES:
+            entry = stale
+            self.hits += 1
+        else:
+            if stale is not None:
+                self.channels.pop(key, None)
+                self.reconnects += 1
+                if stale.borrowed > 0:
+                    stale.pooled = False
+                else:
+                    await stale.close()
+            entry = self.channels[key] = GRPCPooledChannel(key, open_channel(config, interceptors), True)
+            self.misses += 1
+
+        entry.borrowed += 1
+        entry.last_used = monotonic()
+        return entry
+
+    async def release(self, entry: GRPCPooledChannel) -> None:
+        """Return borrowed channel."""
+        entry.borrowed -= 1
+        entry.last_used = monotonic()
+        if entry.pooled:
+            await self.evict()
+        elif entry.borrowed <= 0:
+            await entry.close()
+
+    async def evict(self) -> None:
+        """Close expired, unhealthy idle channels and cap idle channels."""
+        now = monotonic()
+        idle = sorted(
+            (entry for entry in self.channels.values() if entry.borrowed <= 0),
+            key=lambda entry: entry.last_used,
+        )
+        expired = len(idle) - self.__max_idle__
+        for index, entry in enumerate(idle):
+            if index < expired or now - entry.last_used > self.__idle_timeout__ or entry.state in UNHEALTHY_STATES:
+                self.channels.pop(entry.key, None)
+                await entry.close()
+
+    async def close(self) -> None:
+        """Close all pooled channels."""
+        channels = list(self.channels.values())
+        self.channels.clear()
+        for entry in channels:
+            await entry.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "channels": len(self.channels),
+            "borrowed": sum(entry.borrowed for entry in self.channels.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "reconnects": self.reconnects,
+            "states": {
+                state.name: count
+                for state in ChannelConnectivity
+                if (count := sum(1 for entry in self.channels.values() if entry.state is state))
+            },
+        }
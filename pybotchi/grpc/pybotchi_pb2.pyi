@@ -16,7 +16,7 @@ class Event(_message.Message):
     def __init__(self, name: _Optional[str] = ..., data: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ...) -> None: ...
 
 class ActionListRequest(_message.Message):
-    __slots__ = ("groups", "allowed_actions")
+    __slots__ = ("groups", "allowed_actions", "version")
     class AllowedActionsEntry(_message.Message):
         __slots__ = ("key", "value")
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -26,17 +26,23 @@ class ActionListRequest(_message.Message):
         def __init__(self, key: _Optional[str] = ..., value: bool = ...) -> None: ...
     GROUPS_FIELD_NUMBER: _ClassVar[int]
     ALLOWED_ACTIONS_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
     groups: _containers.RepeatedScalarFieldContainer[str]
     allowed_actions: _containers.ScalarMap[str, bool]
-    def __init__(self, groups: _Optional[_Iterable[str]] = ..., allowed_actions: _Optional[_Mapping[str, bool]] = ...) -> None: ...
+    version: str
+    def __init__(self, groups: _Optional[_Iterable[str]] = ..., allowed_actions: _Optional[_Mapping[str, bool]] = ..., version: _Optional[str] = ...) -> None: ...
 
 class ActionListResponse(_message.Message):
-    __slots__ = ("agent_id", "actions")
+    __slots__ = ("agent_id", "actions", "version", "not_modified")
     AGENT_ID_FIELD_NUMBER: _ClassVar[int]
     ACTIONS_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     agent_id: str
     actions: _containers.RepeatedCompositeFieldContainer[ActionSchema]
-    def __init__(self, agent_id: _Optional[str] = ..., actions: _Optional[_Iterable[_Union[ActionSchema, _Mapping]]] = ...) -> None: ...
+    version: str
+    not_modified: bool
+    def __init__(self, agent_id: _Optional[str] = ..., actions: _Optional[_Iterable[_Union[ActionSchema, _Mapping]]] = ..., version: _Optional[str] = ..., not_modified: bool = ...) -> None: ...
 
 class ActionSchema(_message.Message):
     __slots__ = ("concurrent", "group", "schema")
@@ -1,20 +1,130 @@
 """Pybotchi LLMs."""
 
+from collections import deque
+from collections.abc import AsyncIterator
+from threading import Lock
+from time import monotonic
 from typing import Any, Literal, TypeVar, overload
 
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+from .resource import RateLimiter
+
 T = TypeVar("T")
 
 
+class Hedge:
+    """Hedging policy of a registry entry.
+
+    Latencies of recent calls are tracked online. Once `min_samples` are recorded,
+    calls slower than the `percentile` latency are duplicated to `alternate`.
+    """
+
+    def __init__(
+        self,
+        alternate: str | None = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        """Initialize policy."""
+        self.alternate = alternate
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.hedged = 0
+        self.won = 0
+
+    def record(self, latency: float) -> None:
+        """Record call latency."""
+        self.latencies.append(latency)
+
+    def delay(self, percentile: float | None = None) -> float | None:
+        """Get hedge delay, None while there are not enough samples."""
+        if len(self.latencies) < self.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * (percentile or self.percentile)), len(ordered) - 1)]
+
+    def stats(self) -> dict[str, Any]:
+        """Get hedging statistics."""
+        return {
+            "alternate": self.alternate,
+            "samples": len(self.latencies),
+            "delay": self.delay(),
+            "hedged": self.hedged,
+            "won": self.won,
+        }
+
+
 class LLM:
     """LLM Handler."""
 
     __instances__: dict[str, Any] = {}
+    __limiters__: dict[str, RateLimiter] = {}
+    __hedges__: dict[str, Hedge] = {}
 
     @classmethod
     def add(cls, **llms: Any) -> None:
-        """Add multiple llms."""
+        """Add multiple llms. A list of chat models is registered as an `LLMPool`."""
         for key, llm in llms.items():
-            cls.__instances__[key] = llm
+            cls.__instances__[key] = LLMPool(members=llm) if isinstance(llm, list) else llm
+
+    @classmethod
+    def limit(cls, llm: str, rpm: int | None = None, tpm: int | None = None) -> RateLimiter:
+        """Attach requests and tokens per minute quota to registered llm."""
+        limiter = cls.__limiters__[llm] = RateLimiter(rpm, tpm)
+        return limiter
+
+    @classmethod
+    def limiter(cls, llm: Any) -> RateLimiter | None:
+        """Get rate limiter of llm instance."""
+        if not cls.__limiters__ or (key := cls.key(llm)) is None:
+            return None
+        return cls.__limiters__.get(key)
+
+    @classmethod
+    def limits(cls) -> dict[str, dict[str, float]]:
+        """Get usage of all rate limiters."""
+        return {key: limiter.stats() for key, limiter in cls.__limiters__.items()}
+
+    @classmethod
+    def hedge(
+        cls,
+        llm: str,
+        alternate: str | None = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> Hedge:
+        """Attach hedging policy to registered llm. Without alternate, latencies are only tracked."""
+        if alternate is not None and alternate not in cls.__instances__:
+            raise NotImplementedError(f"`{alternate}` LLM is not yet available!")
+        hedge = cls.__hedges__[llm] = Hedge(alternate, percentile, min_samples, window)
+        return hedge
+
+    @classmethod
+    def hedges(cls) -> dict[str, dict[str, Any]]:
+        """Get statistics of all hedging policies."""
+        return {key: hedge.stats() for key, hedge in cls.__hedges__.items()}
+
+    @classmethod
+    def key(cls, llm: Any) -> str | None:
+        """Get registry key of llm instance, unwrapping bindings (tools, config)."""
+        while (bound := getattr(llm, "bound", None)) is not None:
+            llm = bound
+        return next((key for key, instance in cls.__instances__.items() if instance is llm), None)
+
+    @classmethod
+    def rebind(cls, llm: Any, base: Any) -> Any:
+        """Apply bindings (tools, config) of llm instance to another base llm."""
+        if (bound := getattr(llm, "bound", None)) is None:
+            return base
+        return llm.model_copy(update={"bound": cls.rebind(bound, base)})
 
     @classmethod
     def base(cls, _: type[T] | None = None) -> T:
@@ -53,3 +163,199 @@ class LLM:
             raise Exception(f"LLM `{llm}` is not a valid {type}: {instance}")
         else:
             return None
+
+
+class LLMPoolMember:
+    """Pool member state."""
+
+    def __init__(self, llm: BaseChatModel) -> None:
+        """Initialize member."""
+        self.llm = llm
+        self.model_name: str | None = next(
+            (name for source in ("model", "model_name", "deployment_name") if (name := getattr(llm, source, None))),
+            None,
+        )
+        self.in_flight = 0
+        self.latency = 0.0
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Get member statistics."""
+        return {
+            "in_flight": self.in_flight,
+            "latency": self.latency,
+            "failures": self.failures,
+            "ejected": self.ejected_until > monotonic(),
+        }
+
+
+class LLMPool(BaseChatModel):
+    """Load balanced pool of chat models behaving as a single chat model.
+
+    Members are picked by `round_robin`, `least_in_flight` or `ewma` (lowest
+    exponentially weighted latency per in-flight request). Members failing
+    `max_failures` times in a row are ejected for `ejection_time` seconds; failed
+    calls fail over to the next member when `failover` is set. Members are called
+    through `invoke`/`astream` and the serving member's model is reported as
+    `model_name` in the response metadata.
+    """
+
+    members: list[BaseChatModel]
+    strategy: Literal["round_robin", "least_in_flight", "ewma"] = "least_in_flight"
+    max_failures: int = 3
+    ejection_time: float = 30.0
+    ewma_alpha: float = 0.3
+    failover: bool = True
+    model_name: str | None = None
+
+    _states: list[LLMPoolMember] = PrivateAttr(default_factory=list)
+    _counter: int = PrivateAttr(0)
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Initialize member states."""
+        super().model_post_init(context)
+        if not self.members:
+            raise ValueError("LLMPool requires at least one member!")
+        self._states = [LLMPoolMember(member) for member in self.members]
+        if self.model_name is None:
+            self.model_name = self._states[0].model_name
+
+    @property
+    def _llm_type(self) -> str:
+        # members share one provider format (see `bind_tools`)
+        return self.members[0]._llm_type
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {"strategy": self.strategy, "members": [member._identifying_params for member in self.members]}
+
+    def candidates(self) -> list[LLMPoolMember]:
+        """Get members in selection order, ejected members last."""
+        with self._lock:
+            now = monotonic()
+            self._counter += 1
+            offset = self._counter % len(self._states)
+            states = self._states[offset:] + self._states[:offset]
+            match self.strategy:
+                case "least_in_flight":
+                    states.sort(key=lambda state: state.in_flight)
+                case "ewma":
+                    states.sort(key=lambda state: state.latency * (state.in_flight + 1))
+            healthy = [state for state in states if state.ejected_until <= now]
+            ejected = sorted((state for state in states if state.ejected_until > now), key=lambda s: s.ejected_until)
+            return healthy + ejected
+
+    def acquire(self, state: LLMPoolMember) -> float:
+        """Mark member call started."""
+        with self._lock:
+            state.in_flight += 1
+        return monotonic()
+
+    def release(self, state: LLMPoolMember, started: float, error: bool | None) -> None:
+        """Mark member call finished and update its health and latency.
+
+        `error=None` (cancelled call) leaves health and latency untouched.
+        """
+        with self._lock:
+            state.in_flight -= 1
+            if error is None:
+                return
+            if error:
+                state.failures += 1
+                if state.failures >= self.max_failures:
+                    state.ejected_until = monotonic() + self.ejection_time
+                    state.failures = 0
+            else:
+                latency = monotonic() - started
+                state.latency = (
+                    latency
+                    if not state.latency
+                    else (self.ewma_alpha * latency + (1 - self.ewma_alpha) * state.latency)
+                )
+                state.failures = 0
+                state.ejected_until = 0.0
+
+    def bind_tools(self, tools: Any, *, tool_choice: str | None = None, **kwargs: Any) -> Any:
+        """Bind tools using the first member's provider format."""
+        bound = self.members[0].bind_tools(tools, tool_choice=tool_choice, **kwargs)
+        return self.bind(**getattr(bound, "kwargs", {}))
+
+    def result(self, state: LLMPoolMember, message: BaseMessage) -> ChatResult:
+        """Build pool result reporting the member model that served the call."""
+        if state.model_name:
+            message.response_metadata.setdefault("model_name", state.model_name)
+        return ChatResult(generations=[ChatGeneration(message=message)], llm_output={"model_name": state.model_name})
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        candidates = self.candidates()
+        for index, state in enumerate(candidates):
+            started = self.acquire(state)
+            error: bool | None = None
+            try:
+                message = state.llm.invoke(messages, stop=stop, **kwargs)
+                error = False
+            except Exception:
+                error = True
+                if not self.failover or index == len(candidates) - 1:
+                    raise
+                continue
+            finally:
+                self.release(state, started, error)
+            return self.result(state, message)
+        raise RuntimeError("LLMPool has no members!")
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        candidates = self.candidates()
+        for index, state in enumerate(candidates):
+            started = self.acquire(state)
+            error: bool | None = None
+            try:
+                message = await state.llm.ainvoke(messages, stop=stop, **kwargs)
+                error = False
+            except Exception:
+                error = True
+                if not self.failover or index == len(candidates) - 1:
+                    raise
+                continue
+            finally:
+                self.release(state, started, error)
+            return self.result(state, message)
+        raise RuntimeError("LLMPool has no members!")
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        state = self.candidates()[0]
+        started = self.acquire(state)
+        error: bool | None = None
+        try:
+            async for chunk in state.llm.astream(messages, stop=stop, **kwargs):
+                yield ChatGenerationChunk(message=chunk)
+            error = False
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.release(state, started, error)
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Get per member statistics."""
+        return [state.stats() for state in self._states]
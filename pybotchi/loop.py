@@ -0,0 +1,113 @@
+"""Pybotchi Event Loop Pool."""
+
+from asyncio import AbstractEventLoop, new_event_loop, run_coroutine_threadsafe, set_event_loop
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from os import getenv
+from threading import Event, Lock, Thread
+from typing import Any, ClassVar, TypeVar
+
+T = TypeVar("T")
+
+LOOP_POOL_SIZE = int(getenv("LOOP_POOL_SIZE", "4"))
+
+
+class LoopWorker:
+    """Thread with its own persistent event loop."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize worker and start its thread."""
+        self.loop: AbstractEventLoop = new_event_loop()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self._lock = Lock()
+        self._ready = Event()
+        self.thread = Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+        self._ready.wait()
+
+    def _run(self) -> None:
+        set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def submit(self, task: Coroutine[Any, Any, T]) -> Future[T]:
+        """Submit coroutine to this worker's loop."""
+        with self._lock:
+            self.pending += 1
+        future = run_coroutine_threadsafe(task, self.loop)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future[Any]) -> None:
+        with self._lock:
+            self.pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop loop and optionally wait for its thread."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if wait:
+            self.thread.join()
+
+
+class LoopPool:
+    """Pool of long-lived threads each running a persistent event loop.
+
+    Coroutines go to the worker with the fewest pending tasks. Loop-bound resources
+    (httpx clients, MCP sessions, gRPC channels) survive across submissions.
+    """
+
+    __instance__: ClassVar["LoopPool | None"] = None
+    __lock__: ClassVar[Lock] = Lock()
+
+    def __init__(self, size: int = LOOP_POOL_SIZE, name: str = "pybotchi-loop") -> None:
+        """Initialize pool. Workers are started on first use."""
+        self.size = max(size, 1)
+        self.name = name
+        self.workers: list[LoopWorker] = []
+        self._lock = Lock()
+
+    @classmethod
+    def get(cls) -> "LoopPool":
+        """Get shared pool."""
+        if cls.__instance__ is None:
+            with cls.__lock__:
+                if cls.__instance__ is None:
+                    cls.__instance__ = cls()
+        return cls.__instance__
+
+    def worker(self) -> LoopWorker:
+        """Get least loaded worker, starting a new one while below size."""
+        with self._lock:
+            idle = min(self.workers, key=lambda worker: worker.pending, default=None)
+            if idle is None or (idle.pending and len(self.workers) < self.size):
+                idle = LoopWorker(f"{self.name}-{len(self.workers)}")
+                self.workers.append(idle)
+            return idle
+
+    def submit(self, task: Coroutine[Any, Any, T]) -> Future[T]:
+        """Submit coroutine to the least loaded loop."""
+        return self.worker().submit(task)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all workers."""
+        with self._lock:
+            workers = self.workers
+            self.workers = []
+        for worker in workers:
+            worker.stop(wait)
+
+    def stats(self) -> list[dict[str, int]]:
+        """Get per loop task accounting."""
+        return [
+            {"pending": worker.pending, "completed": worker.completed, "failed": worker.failed}
+            for worker in self.workers
+        ]
@@ -1,11 +1,15 @@
 """Pybotchi MCP."""
 
 try:
-    from .action import MCPAction, MCPToolAction, build_mcp_app, graph, mount_mcp_app
+    from .action import MCP_TOOL_REGISTRY, MCPAction, MCPToolAction, build_mcp_app, graph, mount_mcp_app
+    from .catalog import MCP_TOOL_CATALOG
     from .common import MCPConfig, MCPConnection, MCPIntegration, MCPMode
     from .context import MCPContext
+    from .pool import MCPSessionPool
 
     __all__ = [
+        "MCP_TOOL_REGISTRY",
+        "MCP_TOOL_CATALOG",
         "MCPAction",
         "MCPToolAction",
         "build_mcp_app",
@@ -16,6 +20,7 @@ try:
         "MCPIntegration",
         "MCPMode",
         "MCPContext",
+        "MCPSessionPool",
     ]
 except ModuleNotFoundError as e:
     raise ModuleNotFoundError(
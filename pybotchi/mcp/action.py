@@ -1,17 +1,15 @@
 """Pybotchi MCP Classes."""
 
-from collections.abc import AsyncGenerator, AsyncIterator, Awaitable
+from asyncio import Lock, TaskGroup, timeout
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Hashable
 from contextlib import AsyncExitStack, asynccontextmanager, suppress
 from datetime import timedelta
+from functools import partial
 from inspect import getdoc, getmembers
 from os import getenv
+from time import perf_counter
 from typing import Any, Callable, Generic, Literal
 
-from datamodel_code_generator import DataModelType, Formatter, PythonVersion
-from datamodel_code_generator.model import DataModelSet, get_data_model_types
-from datamodel_code_generator.parser.jsonschema import (
-    JsonSchemaParser,
-)
 from httpx import AsyncClient, Timeout
 from mcp import ClientSession, Tool
 from mcp.client.sse import sse_client
@@ -27,23 +25,25 @@ from mcp.types import (
     ImageContent,
     ResourceLink,
     ServerCapabilities,
+    ServerNotification,
     TextContent,
     TextResourceContents,
+    ToolListChangedNotification,
 )
 from orjson import dumps, loads
 from starlette.applications import AppType, Starlette
 from starlette.routing import Mount
 
-from ..action import Action, ChildActions
+from ..action import Action, ActionClasses, ActionStub, ChildActions, materialize
+from ..cache import ActionRegistry, schema_hash
 from ..common import ActionResult, ActionReturn, ChatRole, Graph, Stop
-from ..utils import is_camel_case, string_to_camel_case, unwrap_exceptions
+from ..schema import build_model, to_class_name
+from .catalog import MCP_TOOL_CATALOG
 from .common import MCPConfig, MCPConnection, MCPIntegration, MCPMode
-from .context import TContext
+from .context import MCPContext, TContext
+from .pool import MCPPooledSession, MCPSessionPool, session_key
 
-DMT: DataModelSet = get_data_model_types(
-    DataModelType.PydanticV2BaseModel,
-    target_python_version=PythonVersion.PY_313,
-)
+MCP_TOOL_REGISTRY: "ActionRegistry[MCPToolAction]" = ActionRegistry(int(getenv("MCP_TOOL_REGISTRY_SIZE", "1024")))
 
 
 class MCPClient:
@@ -52,7 +52,7 @@ class MCPClient:
     def __init__(
         self,
         native: bool,
-        session: ClientSession,
+        session: ClientSession | None,
         name: str,
         config: MCPConfig,
         manual_enable: bool,
@@ -60,6 +60,9 @@ class MCPClient:
         tool_action_class: type["MCPToolAction"] | None,
         block_return: bool,
         exclude_unset: bool,
+        key: Hashable | None = None,
+        tools_ttl: float = 0,
+        connector: Callable[[], Awaitable[MCPPooledSession]] | None = None,
     ) -> None:
         """Build MCP Client."""
         self.native = native
@@ -71,30 +74,55 @@ class MCPClient:
         self.tool_action_class = tool_action_class or MCPToolAction
         self.block_return = block_return
         self.exclude_unset = exclude_unset
-
-    def build_tool(self, tool: Tool) -> tuple[str, type["MCPToolAction"]]:
+        self.key = (name, id(session)) if key is None else key
+        self.tools_ttl = tools_ttl
+        self.connector = connector
+        self.lock = Lock()
+
+    async def connect(self) -> ClientSession:
+        """Get session, connecting on first use."""
+        if self.session is None:
+            if self.connector is None:
+                raise RuntimeError(f"MCP client `{self.name}` is not connected!")
+
+            async with self.lock:
+                if self.session is None:
+                    entry = await self.connector()
+                    self.native = entry.native
+                    self.session = entry.session
+        return self.session
+
+    def build_tool(self, tool: Tool, patch: type[Action] | None = None) -> tuple[str, type["MCPToolAction"]]:
         """Build MCPToolAction."""
-        globals: dict[str, Any] = {}
-        class_name = (
-            f"{tool.name[0].upper()}{tool.name[1:]}" if is_camel_case(tool.name) else string_to_camel_case(tool.name)
+        class_name = to_class_name(tool.name)
+        key = (
+            self.name,
+            tool.name,
+            schema_hash(
+                tool.inputSchema,
+                tool.description,
+                tool.meta,
+                self.native,
+                self.exclude_unset,
+                self.block_return,
+            ),
+            self.tool_action_class,
+            patch,
         )
-        exec(
-            JsonSchemaParser(
-                dumps(tool.inputSchema).decode(),
-                data_model_type=DMT.data_model,
-                data_model_root_type=DMT.root_model,
-                data_model_field_type=DMT.field_model,
-                data_type_manager_type=DMT.data_type_manager,
-                dump_resolve_reference_action=DMT.dump_resolve_reference_action,
-                class_name=class_name,
-                strict_nullable=True,
-                formatters=[Formatter.RUFF_FORMAT, Formatter.RUFF_CHECK],
+        if action := MCP_TOOL_REGISTRY.get(key):
+            return class_name, action
+
+        if patch is not None:
+            _, base_action = self.build_tool(tool)
+            action = type(
+                class_name,
+                (patch, base_action),
+                {"__module__": f"mcp.{self.name}.patched"},
             )
-            .parse()
-            .removeprefix("from __future__ import annotations"),  # type: ignore[union-attr]
-            globals,
-        )
-        base_class = globals[class_name]
+            MCP_TOOL_REGISTRY.set(key, action)
+            return class_name, action
+
+        base_class = build_model(tool.inputSchema, class_name, self.tool_action_class)
 
         concurrent = tool.meta.get("concurrent") if tool.meta else False
         if self.tool_action_class is not MCPToolAction:
@@ -114,7 +142,7 @@ class MCPClient:
             {
                 "__mcp_tool_name__": tool.name,
                 "__mcp_native__": self.native,
-                "__mcp_client__": self,
+                "__mcp_connection__": self.name,
                 "__mcp_exclude_unset__": self.exclude_unset,
                 "__mcp_block_return__": self.block_return,
                 "__concurrent__": concurrent,
@@ -125,24 +153,31 @@ class MCPClient:
         if desc := tool.description:
             action.__doc__ = desc
 
+        MCP_TOOL_REGISTRY.set(key, action)
         return class_name, action
 
-    async def patch_tools(self, actions: ChildActions, mcp_actions: ChildActions) -> ChildActions:
-        """Retrieve Tools."""
-        response = await self.session.list_tools()
-        for tool in response.tools:
-            name, action = self.build_tool(tool)
-            if _tool := mcp_actions.get(name):
-                action = type(
-                    name,
-                    (_tool, action),
-                    {"__module__": f"mcp.{self.name}.patched"},
-                )
-
-            if not self.allowed_tools or self.allowed_tools.get(
-                name, False if self.manual_enable else action.__enabled__
+    def materialize(self, tool: Tool) -> type["MCPToolAction"]:
+        """Build unpatched MCPToolAction class."""
+        return self.build_tool(tool)[1]
+
+    async def patch_tools(self, actions: ChildActions, mcp_actions: ActionClasses, stub: bool = True) -> ChildActions:
+        """Retrieve Tools.
+
+        Disallowed tools are skipped before their classes are built. Unpatched tools
+        are added as `ActionStub` unless `stub` is disabled.
+        """
+        for tool in await MCP_TOOL_CATALOG.list_tools(self):
+            name = to_class_name(tool.name)
+            patch = mcp_actions.get(name)
+            if self.allowed_tools and not self.allowed_tools.get(
+                name, False if self.manual_enable else (patch or self.tool_action_class).__enabled__
             ):
-                actions[name] = action
+                continue
+
+            if stub and patch is None and not self.tool_action_class.__has_as_tool__:
+                actions[name] = ActionStub(name, tool.description, tool.inputSchema, partial(self.materialize, tool))
+            else:
+                actions[name] = self.build_tool(tool, patch)[1]
         return actions
 
 
@@ -153,7 +188,7 @@ class MCPAction(Action[TContext]):
 
     __mcp_clients__: dict[str, MCPClient]
     __mcp_connections__: list[MCPConnection]
-    __mcp_tool_actions__: ChildActions
+    __mcp_tool_actions__: ActionClasses
 
     # --------------------- not inheritable -------------------- #
 
@@ -180,70 +215,14 @@ class MCPAction(Action[TContext]):
     async def pre_mcp(self, context: TContext) -> ActionResult:
         """Execute pre mcp process."""
 
-    async def execute(self, context: TContext, parent: Action | None = None, append: bool = True) -> ActionResult:
-        """Execute main process."""
-        self._parent = parent
-
-        result = None
-        parent_context = context
-        try:
-            if parent and append:
-                parent._actions.append(self)
-
-            if self.__detached__:
-                context = await context.detach_context()
-
-            if context.check_self_recursion(self):
-                return ActionReturn.STOP
-
-            if self.__has_pre_mcp__ and (result := await self.pre_mcp(context)) and result.is_end:
-                return result
-
-            async with multi_mcp_clients(context.integrations, self.__mcp_connections__) as clients:
-                self.__mcp_clients__ = clients
-
-                if self.__has_pre__ and (result := await self.pre(context)) and result.is_end:
-                    return result
-
-                if self.__max_iteration__:
-                    iteration = 0
-                    while iteration < self.__max_iteration__:
-                        if (result := await self.execution(context)) and result.is_break:
-                            break
-                        iteration += 1
-                    if (
-                        result
-                        and result.is_stop
-                        or (
-                            iteration >= self.__max_iteration__
-                            and (result := await self.on_max_iteration(context))
-                            and result.is_end
-                        )
-                    ):
-                        return result
-                elif (result := await self.execution(context)) and result.is_end:
-                    return result
-
-                if self.__has_post__ and (result := await self.post(context)) and result.is_end:
-                    return result
-
-                return result
-        except Exception as exception:
-            if not self.__has_on_error__:
-                self.__to_commit__ = False
-                raise next(unwrap_exceptions(exception)) from None
-            elif (
-                result := await self.on_error(
-                    context,
-                    exception,
-                    unwrap_exceptions(exception),
-                )
-            ) and result.is_end:
-                return result
+    async def execute_lifecycle(self, context: TContext) -> ActionResult:
+        """Execute pre mcp then the lifecycle within MCP client sessions."""
+        if self.__has_pre_mcp__ and (result := await self.pre_mcp(context)) and result.is_end:
             return result
-        finally:
-            if self.__to_commit__ and self.__detached__:
-                await self.commit_context(parent_context, context)
+
+        async with multi_mcp_clients(context.integrations, self.__mcp_connections__, context=context) as clients:
+            self.__mcp_clients__ = clients
+            return await super().execute_lifecycle(context)
 
     async def get_child_actions(self, context: TContext) -> ChildActions:
         """Retrieve child Actions."""
@@ -291,10 +270,22 @@ class MCPToolAction(Action[TContext], Generic[TContext]):
 
     __mcp_tool_name__: str
     __mcp_native__: bool
-    __mcp_client__: MCPClient
+    __mcp_connection__: str
     __mcp_exclude_unset__: bool
     __mcp_block_return__: bool
 
+    @property
+    def __mcp_client__(self) -> MCPClient:
+        """Resolve MCP client from the nearest parent MCPAction."""
+        parent = self._parent
+        while parent is not None:
+            if (clients := getattr(parent, "__mcp_clients__", None)) and (
+                client := clients.get(self.__mcp_connection__)
+            ):
+                return client
+            parent = parent._parent
+        raise RuntimeError(f"MCP client `{self.__mcp_connection__}` is not available!")
+
     def build_progress_callback(self, context: TContext) -> ProgressFnT:
         """Generate progress callback function."""
 
@@ -351,7 +342,7 @@ class MCPToolAction(Action[TContext], Generic[TContext]):
 
     async def pre(self, context: TContext) -> ActionResult:
         """Execute pre process."""
-        tool_args = self.model_dump(exclude_unset=self.__mcp_exclude_unset__)
+        tool_args = self.model_dump(exclude_unset=self.__mcp_exclude_unset__, by_alias=True)
         await context.notify(
             {
                 "event": "mcp-call-tool",
@@ -362,7 +353,8 @@ class MCPToolAction(Action[TContext], Generic[TContext]):
             }
         )
 
-        tool_result = await self.__mcp_client__.session.call_tool(
+        session = await self.__mcp_client__.connect()
+        tool_result = await session.call_tool(
             self.__mcp_tool_name__,
             tool_args,
             progress_callback=self.build_progress_callback(context),
@@ -388,23 +380,119 @@ class MCPToolAction(Action[TContext], Generic[TContext]):
         return None
 
 
+async def open_mcp_session(
+    stack: AsyncExitStack,
+    conn: MCPConnection,
+    mode: MCPMode | str,
+    config: MCPConfig,
+    key: Hashable,
+) -> tuple[ClientSession, bool]:
+    """Open and initialize MCP session."""
+    if mode == MCPMode.SSE:
+        streams = await stack.enter_async_context(
+            sse_client(
+                url=config["url"],
+                headers=config["headers"],
+                timeout=config["timeout"],
+                sse_read_timeout=config["sse_read_timeout"],
+                httpx_client_factory=config["httpx_client_factory"],
+                auth=config["auth"],
+                on_session_created=conn.on_session_created,
+            )
+        )
+    else:
+        async_client = await stack.enter_async_context(
+            AsyncClient(
+                base_url=config["url"],
+                headers=config["headers"],
+                timeout=Timeout(config["timeout"], read=config["sse_read_timeout"]),
+                **config["async_client_args"],
+                follow_redirects=True,
+            )
+        )
+
+        streams = await stack.enter_async_context(
+            streamable_http_client(
+                url=config["url"],
+                http_client=async_client,
+                terminate_on_close=config["terminate_on_close"],
+            )
+        )
+
+    client_session_args: dict[str, Any] = {
+        "read_timeout_seconds": timedelta(
+            seconds=min(
+                config["timeout"],
+                config["sse_read_timeout"],
+            )
+        ),
+        **config["client_session_args"],
+    }
+
+    message_handler = client_session_args.get("message_handler")
+
+    async def handle_message(message: Any) -> None:
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            MCP_TOOL_CATALOG.invalidate(key)
+            MCP_TOOL_REGISTRY.invalidate_tools(conn.name)
+        if message_handler:
+            await message_handler(message)
+
+    client_session_args["message_handler"] = handle_message
+    session = await stack.enter_async_context(ClientSession(streams[0], streams[1], **client_session_args))
+    init = await session.initialize()
+
+    return session, bool((extra := init.capabilities.model_extra) and extra.get("pybotchi_native", False))
+
+
 @asynccontextmanager
 async def multi_mcp_clients(
     integrations: dict[str, MCPIntegration],
     connections: list[MCPConnection],
     bypass: bool = False,
+    context: MCPContext | None = None,
 ) -> AsyncIterator[dict[str, MCPClient]]:
-    """Connect to multiple mcp clients."""
+    """Connect to multiple mcp clients concurrently."""
     async with AsyncExitStack() as stack:
+        pool = MCPSessionPool.get()
         clients: dict[str, MCPClient] = {}
-        for conn in connections:
-            integration: MCPIntegration | None = integrations.get(conn.name)
-            if not bypass and (conn.require_integration and integration is None):
-                continue
 
-            if integration is None:
-                integration = {}
+        async def acquire(
+            conn: MCPConnection, key: Hashable, mode: MCPMode | str, config: MCPConfig, pooled: bool
+        ) -> MCPPooledSession:
+            started = perf_counter()
+            try:
+                async with timeout(conn.connect_timeout):
+                    entry = await pool.acquire(
+                        key,
+                        partial(open_mcp_session, conn=conn, mode=mode, config=config, key=key),
+                        pooled,
+                    )
+            except Exception as exception:
+                if context:
+                    await context.notify(
+                        {
+                            "event": "mcp-connect",
+                            "type": conn.name,
+                            "status": "failed",
+                            "data": {"latency": perf_counter() - started, "error": repr(exception)},
+                        }
+                    )
+                raise
+
+            stack.push_async_callback(pool.release, entry)
+            if context:
+                await context.notify(
+                    {
+                        "event": "mcp-connect",
+                        "type": conn.name,
+                        "status": "completed",
+                        "data": {"latency": perf_counter() - started},
+                    }
+                )
+            return entry
 
+        async def connect(conn: MCPConnection, integration: MCPIntegration) -> None:
             overrided_config = conn.get_config(integration.get("config"))
             if _allowed_tools := integration.get("allowed_tools"):
                 allowed_tools = conn.allowed_tools | _allowed_tools
@@ -413,55 +501,14 @@ async def multi_mcp_clients(
             else:
                 allowed_tools = conn.allowed_tools
 
-            if integration.get("mode", conn.mode) == MCPMode.SSE:
+            mode = integration.get("mode", conn.mode)
+            if mode == MCPMode.SSE:
                 overrided_config.pop("terminate_on_close", None)
-                streams = await stack.enter_async_context(
-                    sse_client(
-                        url=overrided_config["url"],
-                        headers=overrided_config["headers"],
-                        timeout=overrided_config["timeout"],
-                        sse_read_timeout=overrided_config["sse_read_timeout"],
-                        httpx_client_factory=overrided_config["httpx_client_factory"],
-                        auth=overrided_config["auth"],
-                        on_session_created=conn.on_session_created,
-                    )
-                )
-            else:
-                async_client = await stack.enter_async_context(
-                    AsyncClient(
-                        base_url=overrided_config["url"],
-                        headers=overrided_config["headers"],
-                        timeout=Timeout(overrided_config["timeout"], read=overrided_config["sse_read_timeout"]),
-                        **overrided_config["async_client_args"],
-                        follow_redirects=True,
-                    )
-                )
 
-                streams = await stack.enter_async_context(
-                    streamable_http_client(
-                        url=overrided_config["url"],
-                        http_client=async_client,
-                        terminate_on_close=overrided_config["terminate_on_close"],
-                    )
-                )
-
-            client_session_args: dict[str, Any] = {
-                "read_timeout_seconds": timedelta(
-                    seconds=min(
-                        overrided_config["timeout"],
-                        overrided_config["sse_read_timeout"],
-                    )
-                ),
-                **overrided_config["client_session_args"],
-            }
-            session = await stack.enter_async_context(ClientSession(streams[0], streams[1], **client_session_args))
-            init = await session.initialize()
-
-            native = bool((extra := init.capabilities.model_extra) and extra.get("pybotchi_native", False))
-
-            clients[conn.name] = MCPClient(
-                native,
-                session,
+            key = session_key(mode, overrided_config, conn.on_session_created)
+            client = MCPClient(
+                False,
+                None,
                 conn.name,
                 overrided_config,
                 conn.manual_enable,
@@ -472,9 +519,32 @@ async def multi_mcp_clients(
                     "exclude_unset",
                     conn.exclude_unset,
                 ),
+                key,
+                integration.get("tools_ttl", conn.tools_ttl),
+                partial(acquire, conn, key, mode, overrided_config, integration.get("pooled", conn.pooled)),
             )
 
-        yield clients
+            if integration.get("lazy", conn.lazy) and (cached := MCP_TOOL_CATALOG.get(key)) is not None:
+                # tools are selectable from cached catalog, session opens on first call
+                client.native = cached[1]
+            else:
+                try:
+                    await client.connect()
+                except Exception:
+                    if conn.require_connection:
+                        raise
+                    return
+
+            clients[conn.name] = client
+
+        async with TaskGroup() as tg:
+            for conn in connections:
+                integration: MCPIntegration | None = integrations.get(conn.name)
+                if not bypass and (conn.require_integration and integration is None):
+                    continue
+                tg.create_task(connect(conn, {} if integration is None else integration))
+
+        yield {conn.name: clients[conn.name] for conn in connections if conn.name in clients}
 
 
 def initialize_mcp_groups(stateless_groups: dict[str, bool] | bool) -> None:
@@ -604,8 +674,6 @@ def build_mcp_entry(action_cls: type["Action"]) -> Callable[..., Awaitable[str]]
     """Build MCP Entry."""
     from mcp.server.fastmcp import Context as FastMCPContext
 
-    from .context import MCPContext
-
     async def process(context: FastMCPContext, data: dict[str, Any]) -> CallToolResult:
         source_context = (
             (extra.get("context") or {})
@@ -713,6 +781,7 @@ async def traverse(
     """Retrieve Graph."""
     current = f"{action.__module__}.{action.__qualname__}"
 
+    child_actions: ChildActions
     if allowed_actions:
         child_actions = {
             name: child
@@ -720,20 +789,20 @@ async def traverse(
             if allowed_actions.get(name, child.__enabled__)
         }
     else:
-        child_actions = action.__child_actions__.copy()
+        child_actions = {**action.__child_actions__}
 
     if issubclass(action, MCPAction):
         async with multi_mcp_clients(integrations, action.__mcp_connections__, bypass) as clients:
-            [await client.patch_tools(child_actions, action.__mcp_tool_actions__) for client in clients.values()]
+            [await client.patch_tools(child_actions, action.__mcp_tool_actions__, False) for client in clients.values()]
 
-    for child_action in child_actions.values():
+    for child_action in materialize(child_actions).values():
         child = f"{child_action.__module__}.{child_action.__qualname__}"
         graph.edges.add(
             (
                 current,
                 child,
                 child_action.__concurrent__,
-                (child_action.__mcp_client__.name if issubclass(child_action, MCPToolAction) else ""),
+                (child_action.__mcp_connection__ if issubclass(child_action, MCPToolAction) else ""),
             )
         )
 
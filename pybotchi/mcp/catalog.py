@@ -0,0 +1,79 @@
+"""Pybotchi MCP Tool Catalog."""
+
+from collections.abc import Hashable
+from os import getenv
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from mcp import Tool
+
+from ..cache import LRUCache
+
+if TYPE_CHECKING:
+    from .action import MCPClient
+
+
+class MCPToolCatalog:
+    """Process level cache of MCP `list_tools` results.
+
+    Catalogs are keyed by the pool session key so servers exposing different tools
+    per header/auth never share entries. Entries expire after the connection's TTL
+    or once the server sends `notifications/tools/list_changed`. The server's native
+    flag is kept alongside so tools can be built without a live session.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize catalog."""
+        self.entries: LRUCache[Hashable, tuple[list[Tool], bool, float]] = LRUCache(maxsize)
+        self.saved = 0
+        self.fetched = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> tuple[list[Tool], bool] | None:
+        """Get cached tools and native flag if not yet expired."""
+        if (entry := self.entries.get(key)) is None:
+            return None
+
+        tools, native, expires_at = entry
+        if monotonic() >= expires_at:
+            self.entries.pop(key)
+            return None
+        return tools, native
+
+    def set(self, key: Hashable, tools: list[Tool], native: bool, ttl: float) -> None:
+        """Cache tools."""
+        self.entries.set(key, (tools, native, monotonic() + ttl))
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove cached tools of a server."""
+        if self.entries.pop(key) is not None:
+            self.invalidations += 1
+
+    async def list_tools(self, client: "MCPClient") -> list[Tool]:
+        """List client tools, reusing cached catalog within TTL."""
+        if client.tools_ttl > 0 and (cached := self.get(client.key)) is not None:
+            self.saved += 1
+            return cached[0]
+
+        response = await (await client.connect()).list_tools()
+        self.fetched += 1
+        if client.tools_ttl > 0:
+            self.set(client.key, response.tools, client.native, client.tools_ttl)
+        return response.tools
+
+    def clear(self) -> None:
+        """Remove all catalogs and reset counters."""
+        self.entries.clear()
+        self.saved = self.fetched = self.invalidations = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get catalog statistics."""
+        return {
+            "size": len(self.entries),
+            "saved": self.saved,
+            "fetched": self.fetched,
+            "invalidations": self.invalidations,
+        }
+
+
+MCP_TOOL_CATALOG = MCPToolCatalog(int(getenv("MCP_TOOL_CATALOG_SIZE", "256")))
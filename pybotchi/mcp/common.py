@@ -85,6 +85,9 @@ class MCPIntegration(TypedDict, total=False):
     config: MCPConfig
     allowed_tools: dict[str, bool]
     exclude_unset: bool
+    pooled: bool
+    tools_ttl: float
+    lazy: bool
 
 
 class MCPConnection:
@@ -110,6 +113,11 @@ class MCPConnection:
         block_return: bool = False,
         exclude_unset: bool = True,
         require_integration: bool = True,
+        pooled: bool = True,
+        tools_ttl: float = 60.0,
+        connect_timeout: float | None = None,
+        require_connection: bool = True,
+        lazy: bool = False,
     ) -> None:
         """Build MCP Connection."""
         self.name = name
@@ -130,6 +138,11 @@ class MCPConnection:
         self.block_return = block_return
         self.exclude_unset = exclude_unset
         self.require_integration = require_integration
+        self.pooled = pooled
+        self.tools_ttl = tools_ttl
+        self.connect_timeout = connect_timeout
+        self.require_connection = require_connection
+        self.lazy = lazy
 
     def get_config(self, override: MCPConfig | None) -> MCPConfig:
         """Generate config."""
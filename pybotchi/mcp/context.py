@@ -1,6 +1,5 @@
 """Pybotchi MCP Context."""
 
-from copy import deepcopy
 from typing import Any, TypeVar
 
 from mcp.server.fastmcp import Context as FastMCPContext
@@ -36,4 +35,4 @@ class MCPContext(Context[TLLM]):
 
     def detached_kwargs(self, **kwargs: Any) -> dict[str, Any]:
         """Retrieve detached kwargs."""
-        return super().detached_kwargs(integrations=deepcopy(self.integrations))
+        return super().detached_kwargs(integrations=self.share("integrations"), **kwargs)
@@ -0,0 +1,207 @@
+"""Pybotchi MCP Session Pool."""
+
+from asyncio import AbstractEventLoop, Event, Future, Lock, Task, get_running_loop, wait_for
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import AsyncExitStack, suppress
+from os import getenv
+from time import monotonic
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
+
+from mcp import ClientSession
+
+from ..cache import schema_hash
+from .common import MCPConfig, MCPMode
+
+type SessionOpener = Callable[[AsyncExitStack], Awaitable[tuple[ClientSession, bool]]]
+
+
+def session_key(mode: MCPMode | str, config: MCPConfig, *extras: Any) -> Hashable:
+    """Generate pool key from effective config."""
+    return (
+        mode,
+        config["url"],
+        tuple(sorted((config["headers"] or {}).items())),
+        id(config["auth"]),
+        id(config["httpx_client_factory"]),
+        config["timeout"],
+        config["sse_read_timeout"],
+        config.get("terminate_on_close"),
+        schema_hash(config["async_client_args"], config["client_session_args"]),
+        *(id(extra) for extra in extras),
+    )
+
+
+class MCPPooledSession:
+    """MCP session kept alive by its own task."""
+
+    session: ClientSession
+    native: bool
+
+    def __init__(self, key: Hashable, pooled: bool) -> None:
+        """Initialize pooled session."""
+        self.key = key
+        self.pooled = pooled
+        self.borrowed = 0
+        self.last_used = monotonic()
+        self.closed = False
+        self.closing = Event()
+        self.task: Task[None] | None = None
+
+    async def hold(self, opener: SessionOpener, ready: Future[None]) -> None:
+        """Open session and keep its transports alive until closed."""
+        try:
+            async with AsyncExitStack() as stack:
+                self.session, self.native = await opener(stack)
+                ready.set_result(None)
+                await self.closing.wait()
+        except Exception as exception:
+            if not ready.done():
+                ready.set_exception(exception)
+        finally:
+            self.closed = True
+            if not ready.done():
+                ready.cancel()
+
+    async def close(self) -> None:
+        """Close session and wait for its transports to shut down."""
+        self.closing.set()
+        if self.task:
+            with suppress(Exception):
+                await self.task
+
+
+class MCPSessionPool:
+    """Process level MCP session pool.
+
+    One pool per event loop. Sessions are keyed by the effective MCPConfig and
+    shared by concurrent borrowers since MCP multiplexes requests per session.
+    """
+
+    __max_idle__: int = int(getenv("MCP_POOL_MAX_IDLE", "32"))
+    __idle_timeout__: float = float(getenv("MCP_POOL_IDLE_TIMEOUT", "300"))
+    __health_check_interval__: float = float(getenv("MCP_POOL_HEALTH_CHECK_INTERVAL", "30"))
+    __health_check_timeout__: float = float(getenv("MCP_POOL_HEALTH_CHECK_TIMEOUT", "5"))
+
+    __pools__: ClassVar[WeakKeyDictionary[AbstractEventLoop, "MCPSessionPool"]] = WeakKeyDictionary()
+
+    def __init__(self) -> None:
+        """Initialize pool."""
+        self.sessions: dict[Hashable, MCPPooledSession] = {}
+        self.locks: dict[Hashable, Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reconnects = 0
+
+    @classmethod
+    def get(cls) -> "MCPSessionPool":
+        """Get pool of the running event loop."""
+        loop = get_running_loop()
+        if (pool := cls.__pools__.get(loop)) is None:
+            pool = cls.__pools__[loop] = cls()
+        return pool
+
+    async def open(self, key: Hashable, opener: SessionOpener, pooled: bool) -> MCPPooledSession:
+        """Open new session."""
+        entry = MCPPooledSession(key, pooled)
+        ready: Future[None] = get_running_loop().create_future()
+        entry.task = get_running_loop().create_task(entry.hold(opener, ready))
+        try:
+            await ready
+        except BaseException:
+            entry.closing.set()
+            entry.task.cancel()
+            with suppress(BaseException):
+                await entry.task
+            raise
+        return entry
+
+    async def check(self, entry: MCPPooledSession) -> bool:
+        """Check session health, pinging it if idle for too long."""
+        if entry.closed:
+            return False
+
+        if monotonic() - entry.last_used > self.__health_check_interval__:
+            try:
+                await wait_for(entry.session.send_ping(), self.__health_check_timeout__)
+            except Exception:
+                return False
+        return True
+
+    async def acquire(self, key: Hashable, opener: SessionOpener, pooled: bool = True) -> MCPPooledSession:
+        """Borrow session."""
+        if not pooled:
+            entry = await self.open(key, opener, False)
+            entry.borrowed += 1
+            return entry
+
+        if (lock := self.locks.get(key)) is None:
+            lock = self.locks[key] = Lock()
+
+        async with lock:
+            if (stale := self.sessions.get(key)) is not None and await self.check(stale):
+                entry = stale
+                self.hits += 1
+            else:
+                if stale is not None:
+                    self.sessions.pop(key, None)
+                    self.reconnects += 1
+                    if stale.borrowed > 0:
+                        stale.pooled = False
+                    else:
+                        await stale.close()
+                entry = self.sessions[key] = await self.open(key, opener, True)
+                self.misses += 1
+
+            entry.borrowed += 1
+            entry.last_used = monotonic()
+            return entry
+
+    async def release(self, entry: MCPPooledSession) -> None:
+        """Return borrowed session."""
+        entry.borrowed -= 1
+        entry.last_used = monotonic()
+        if not entry.pooled or entry.closed:
+            if self.sessions.get(entry.key) is entry:
+                self.discard(entry.key)
+            if entry.borrowed <= 0 or entry.closed:
+                await entry.close()
+        else:
+            await self.evict()
+
+    def discard(self, key: Hashable) -> None:
+        """Remove pooled session and its unused lock."""
+        self.sessions.pop(key, None)
+        if (lock := self.locks.get(key)) is not None and not lock.locked():
+            del self.locks[key]
+
+    async def evict(self) -> None:
+        """Close expired idle sessions and cap idle connections."""
+        now = monotonic()
+        idle = sorted(
+            (entry for entry in self.sessions.values() if entry.borrowed <= 0),
+            key=lambda entry: entry.last_used,
+        )
+        expired = len(idle) - self.__max_idle__
+        for index, entry in enumerate(idle):
+            if index < expired or now - entry.last_used > self.__idle_timeout__:
+                self.discard(entry.key)
+                await entry.close()
+
+    async def close(self) -> None:
+        """Close all pooled sessions."""
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        self.locks.clear()
+        for entry in sessions:
+            await entry.close()
+
+    def stats(self) -> dict[str, int]:
+        """Get pool statistics."""
+        return {
+            "sessions": len(self.sessions),
+            "borrowed": sum(entry.borrowed for entry in self.sessions.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "reconnects": self.reconnects,
+        }
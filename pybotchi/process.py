@@ -0,0 +1,81 @@
+"""Pybotchi Process Executor."""
+
+from asyncio import run
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os import getenv
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from .common import ActionEntry, ActionResult, UsageMetadata
+
+if TYPE_CHECKING:
+    from .action import Action
+    from .context import Context
+
+PROCESS_POOL_MAX_WORKERS = int(workers) if (workers := getenv("PROCESS_POOL_MAX_WORKERS")) else None
+PROCESS_POOL_START_METHOD = getenv("PROCESS_POOL_START_METHOD") or None
+
+_in_worker = False
+_executor: ProcessPoolExecutor | None = None
+_lock = Lock()
+
+
+class ProcessOutcome(TypedDict):
+    """Process Execution Outcome."""
+
+    prompts: list[dict[str, Any]]
+    metadata: dict[str, Any]
+    usages: dict[str, UsageMetadata]
+    entry: ActionEntry
+    result: ActionResult
+
+
+def in_worker() -> bool:
+    """Check if running inside a worker process."""
+    return _in_worker
+
+
+def process_executor() -> ProcessPoolExecutor:
+    """Get shared process pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ProcessPoolExecutor(
+                    max_workers=PROCESS_POOL_MAX_WORKERS,
+                    mp_context=get_context(PROCESS_POOL_START_METHOD),
+                )
+    return _executor
+
+
+def shutdown_process_executor(wait: bool = True) -> None:
+    """Shutdown shared process pool."""
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+
+
+def run_action(
+    context_class: type["Context"],
+    context_kwargs: dict[str, Any],
+    action_class: type["Action"],
+    args: dict[str, Any],
+) -> ProcessOutcome:
+    """Run action lifecycle on worker process with context snapshot."""
+    global _in_worker
+    _in_worker = True
+
+    context = context_class(**context_kwargs)
+    offset = len(context.prompts)
+    action = action_class(**args)
+    result = run(action.execute_lifecycle(context))
+    return {
+        "prompts": context.prompts[offset:],
+        "metadata": context.metadata,
+        "usages": context.usages,
+        "entry": action.serialize(),
+        "result": result,
+    }
@@ -0,0 +1,216 @@
+"""Pybotchi Resources."""
+
+from asyncio import AbstractEventLoop, CancelledError, Future, get_running_loop, sleep
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from os import getenv
+from threading import Lock
+from time import monotonic, perf_counter
+
+DEFAULT_RESOURCE_LIMIT = int(getenv("DEFAULT_RESOURCE_LIMIT", "8"))
+RATE_LIMIT_POLL_INTERVAL = float(getenv("RATE_LIMIT_POLL_INTERVAL", "0.01"))
+
+
+class Semaphore:
+    """Fair (FIFO) semaphore usable across event loops and threads."""
+
+    def __init__(self, value: int) -> None:
+        """Initialize semaphore."""
+        self.value = value
+        self.available = value
+        self._lock = Lock()
+        self._waiters: deque[tuple[AbstractEventLoop, Future[None]]] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """Get number of queued acquirers."""
+        return len(self._waiters)
+
+    async def acquire(self) -> float:
+        """Acquire slot and return queue wait in seconds."""
+        started = perf_counter()
+        with self._lock:
+            if self.available > 0 and not self._waiters:
+                self.available -= 1
+                return 0.0
+
+            loop = get_running_loop()
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+
+        try:
+            await waiter
+        except CancelledError:
+            with self._lock:
+                if (loop, waiter) in self._waiters:
+                    self._waiters.remove((loop, waiter))
+                elif waiter.done() and not waiter.cancelled():
+                    self._release()
+            raise
+        return perf_counter() - started
+
+    def release(self) -> None:
+        """Release slot, handing it over to the next waiter."""
+        with self._lock:
+            self._release()
+
+    def _release(self) -> None:
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._grant, waiter)
+                return
+        self.available += 1
+
+    def _grant(self, waiter: Future[None]) -> None:
+        if waiter.done():
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """Hold slot, yielding queue wait in seconds."""
+        wait = await self.acquire()
+        try:
+            yield wait
+        finally:
+            self.release()
+
+
+class RateLimiter:
+    """Token bucket limiter of requests (RPM) and tokens (TPM) per minute.
+
+    Callers queue in FIFO order until both buckets can cover their request. Token
+    estimates are debited upfront and reconciled with actual usage afterwards.
+    """
+
+    def __init__(self, rpm: int | None = None, tpm: int | None = None) -> None:
+        """Initialize limiter with full buckets."""
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = float(rpm or 0)
+        self.tokens = float(tpm or 0)
+        self.updated = monotonic()
+        self.waited = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self._lock = Lock()
+        self._queue: deque[object] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """Get number of queued callers."""
+        return len(self._queue)
+
+    def _refill(self) -> None:
+        now = monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        if self.rpm:
+            self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60)
+
+    def _delay(self, tokens: int) -> float:
+        delay = 0.0
+        if self.rpm and self.requests < 1:
+            delay = (1 - self.requests) * 60 / self.rpm
+        if self.tpm and self.tokens < tokens:
+            delay = max(delay, (tokens - self.tokens) * 60 / self.tpm)
+        return delay
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Take one request and estimated tokens, returning queue wait in seconds.
+
+        Estimates above the TPM quota are capped so oversized prompts still pass once
+        the bucket is full.
+        """
+        tokens = min(tokens, self.tpm) if self.tpm else 0
+        started = perf_counter()
+        ticket = object()
+        queued = False
+        with self._lock:
+            self._queue.append(ticket)
+
+        try:
+            while True:
+                with self._lock:
+                    self._refill()
+                    delay = self._delay(tokens) if self._queue[0] is ticket else RATE_LIMIT_POLL_INTERVAL
+                    if not delay:
+                        self._queue.popleft()
+                        if self.rpm:
+                            self.requests -= 1
+                        self.tokens -= tokens
+                        if not queued:
+                            return 0.0
+                        wait = perf_counter() - started
+                        self.waited += 1
+                        self.wait_time += wait
+                        self.max_wait = max(self.max_wait, wait)
+                        return wait
+                queued = True
+                await sleep(delay)
+        except CancelledError:
+            with self._lock:
+                self._queue.remove(ticket)
+            raise
+
+    def reconcile(self, estimated: int, actual: int) -> None:
+        """Correct token bucket with actual usage of a call."""
+        if self.tpm:
+            with self._lock:
+                self._refill()
+                self.tokens = min(self.tpm, self.tokens + min(estimated, self.tpm) - actual)
+
+    def stats(self) -> dict[str, float]:
+        """Get bucket levels, queue depth and wait time."""
+        with self._lock:
+            self._refill()
+            return {
+                "rpm": self.rpm or 0,
+                "tpm": self.tpm or 0,
+                "requests": self.requests,
+                "tokens": self.tokens,
+                "waiting": len(self._queue),
+                "waited": self.waited,
+                "wait_time": self.wait_time,
+                "max_wait": self.max_wait,
+            }
+
+
+class Resource:
+    """Named process-wide concurrency limits."""
+
+    __instances__: dict[str, Semaphore] = {}
+    __lock__ = Lock()
+
+    @classmethod
+    def add(cls, **limits: int) -> None:
+        """Add multiple resource limits."""
+        with cls.__lock__:
+            for name, limit in limits.items():
+                cls.__instances__[name] = Semaphore(limit)
+
+    @classmethod
+    def get(cls, name: str) -> Semaphore:
+        """Get resource semaphore, creating it with the default limit if missing."""
+        if (semaphore := cls.__instances__.get(name)) is None:
+            with cls.__lock__:
+                if (semaphore := cls.__instances__.get(name)) is None:
+                    semaphore = cls.__instances__[name] = Semaphore(DEFAULT_RESOURCE_LIMIT)
+        return semaphore
+
+    @classmethod
+    def stats(cls) -> dict[str, dict[str, int]]:
+        """Get usage of all resources."""
+        return {
+            name: {
+                "limit": semaphore.value,
+                "in_use": semaphore.value - semaphore.available,
+                "waiting": semaphore.waiting,
+            }
+            for name, semaphore in cls.__instances__.items()
+        }
@@ -0,0 +1,132 @@
+"""Pybotchi Routers."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Collection, Iterable
+from re import IGNORECASE, Pattern, compile, findall
+from typing import Any, TypedDict
+
+
+class Route(TypedDict):
+    """Routed Child Action."""
+
+    name: str
+    args: dict[str, Any]
+    confidence: float
+
+
+class Router(ABC):
+    """Local intent router selecting child actions without an LLM call.
+
+    Routes below `threshold` confidence are ignored. When nothing qualifies, child
+    selection falls back to the LLM.
+    """
+
+    def __init__(self, threshold: float = 0.8, turns: int = 1) -> None:
+        """Initialize router."""
+        self.threshold = threshold
+        self.turns = turns
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def classify(self, text: str, names: Collection[str]) -> list[Route]:
+        """Get candidate routes of text."""
+
+    def route(self, text: str, names: Collection[str]) -> list[Route]:
+        """Get confident routes of available child actions, most confident first."""
+        routes = sorted(
+            (
+                route
+                for route in self.classify(text, names)
+                if route["name"] in names and route["confidence"] >= self.threshold
+            ),
+            key=lambda route: route["confidence"],
+            reverse=True,
+        )
+        if routes:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return routes
+
+    def stats(self) -> dict[str, int]:
+        """Get router statistics."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class RegexRouter(Router):
+    """Route by regex patterns per child action. Named groups become its args."""
+
+    def __init__(
+        self,
+        routes: dict[str, str | Iterable[str]],
+        threshold: float = 0.8,
+        turns: int = 1,
+        flags: int = IGNORECASE,
+    ) -> None:
+        """Initialize router."""
+        super().__init__(threshold, turns)
+        self.patterns: dict[str, list[Pattern[str]]] = {
+            name: [compile(pattern, flags) for pattern in ([patterns] if isinstance(patterns, str) else patterns)]
+            for name, patterns in routes.items()
+        }
+
+    def classify(self, text: str, names: Collection[str]) -> list[Route]:
+        """Get first matching pattern of each child action."""
+        routes: list[Route] = []
+        for name, patterns in self.patterns.items():
+            if name in names and (match := next((m for pattern in patterns if (m := pattern.search(text))), None)):
+                args = {key: value for key, value in match.groupdict().items() if value is not None}
+                routes.append({"name": name, "args": args, "confidence": 1.0})
+        return routes
+
+
+class KeywordRouter(Router):
+    """Route by keywords per child action.
+
+    Confidence is the share of keyword hits going to the child action, so ambiguous
+    turns fall back to the LLM.
+    """
+
+    def __init__(self, routes: dict[str, Iterable[str]], threshold: float = 0.8, turns: int = 1) -> None:
+        """Initialize router."""
+        super().__init__(threshold, turns)
+        self.keywords = {
+            name: [" ".join(findall(r"\w+", keyword.lower())) for keyword in keywords]
+            for name, keywords in routes.items()
+        }
+
+    def classify(self, text: str, names: Collection[str]) -> list[Route]:
+        """Get child action with most keyword hits."""
+        normalized = f" {' '.join(findall(r'\w+', text.lower()))} "
+        hits = {
+            name: sum(f" {keyword} " in normalized for keyword in keywords)
+            for name, keywords in self.keywords.items()
+            if name in names
+        }
+        if not (total := sum(hits.values())):
+            return []
+        name = max(hits, key=hits.__getitem__)
+        return [{"name": name, "args": {}, "confidence": hits[name] / total}]
+
+
+class ClassifierRouter(Router):
+    """Route by a local classifier returning confidence per child action name."""
+
+    def __init__(
+        self,
+        classifier: Callable[[str], dict[str, float]],
+        threshold: float = 0.8,
+        turns: int = 1,
+    ) -> None:
+        """Initialize router."""
+        super().__init__(threshold, turns)
+        self.classifier = classifier
+
+    def classify(self, text: str, names: Collection[str]) -> list[Route]:
+        """Get classifier confidence of each child action."""
+        return [
+            {"name": name, "args": {}, "confidence": confidence}
+            for name, confidence in self.classifier(text).items()
+            if name in names
+        ]
@@ -0,0 +1,229 @@
+"""Pybotchi JSON Schema Compiler."""
+
+from collections.abc import Collection
+from keyword import iskeyword
+from typing import Annotated, Any, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from .utils import is_camel_case, string_to_camel_case
+
+JSON_TYPES: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "null": None,
+}
+
+NUMBER_CONSTRAINTS: dict[str, str] = {
+    "minimum": "ge",
+    "maximum": "le",
+    "exclusiveMinimum": "gt",
+    "exclusiveMaximum": "lt",
+    "multipleOf": "multiple_of",
+}
+
+FIELD_CONSTRAINTS: dict[str, dict[str, str]] = {
+    "string": {"minLength": "min_length", "maxLength": "max_length", "pattern": "pattern"},
+    "integer": NUMBER_CONSTRAINTS,
+    "number": NUMBER_CONSTRAINTS,
+    "array": {"minItems": "min_length", "maxItems": "max_length"},
+}
+
+CONSTRAINT_KEYWORDS = frozenset(keyword for constraints in FIELD_CONSTRAINTS.values() for keyword in constraints)
+
+
+def to_class_name(name: str) -> str:
+    """Convert tool/schema name to class name."""
+    return f"{name[0].upper()}{name[1:]}" if is_camel_case(name) else string_to_camel_case(name)
+
+
+class SchemaCompiler:
+    """Compile JSON Schema directly into pydantic models.
+
+    Supports `$ref` (`$defs`/`definitions`), `allOf`, `anyOf`, `oneOf`, `enum`, `const`,
+    nested objects, arrays and the common field constraints. Unsupported keywords are ignored.
+    Recursive references fall back to `dict[str, Any]`.
+    """
+
+    def __init__(self, schema: dict[str, Any], reserved: type[BaseModel] = BaseModel) -> None:
+        """Initialize compiler."""
+        self.schema = schema
+        self.reserved = reserved
+        self.models: dict[str, Any] = {}
+        self.resolving: set[str] = set()
+
+    def build(self, class_name: str) -> type[BaseModel]:
+        """Build root model."""
+        return self.build_object(self.schema, class_name)
+
+    def resolve(self, ref: str) -> dict[str, Any]:
+        """Resolve local JSON pointer."""
+        if not ref.startswith("#"):
+            raise ValueError(f"Only local references are supported, got `{ref}`!")
+
+        target: Any = self.schema
+        for part in ref[1:].split("/"):
+            if part:
+                target = target[part.replace("~1", "/").replace("~0", "~")]
+        return target
+
+    def compile(self, schema: dict[str, Any] | bool, name: str) -> Any:
+        """Compile schema into type annotation."""
+        if not isinstance(schema, dict):
+            return Any
+
+        if ref := schema.get("$ref") or schema.get("ref"):
+            if (model := self.models.get(ref)) is not None:
+                return model
+            if ref == "#" or ref in self.resolving:
+                return dict[str, Any]
+
+            self.resolving.add(ref)
+            try:
+                model = self.models[ref] = self.compile(self.resolve(ref), to_class_name(ref.rsplit("/", 1)[-1]))
+            finally:
+                self.resolving.discard(ref)
+            return model
+
+        if all_of := schema.get("allOf"):
+            if len(all_of) == 1:
+                return self.compile(all_of[0], name)
+            return self.compile(self.merge(all_of), name)
+
+        if any_of := schema.get("anyOf") or schema.get("oneOf"):
+            constraints = {key: value for key, value in schema.items() if key in CONSTRAINT_KEYWORDS}
+            return self.union(
+                [
+                    self.compile({**constraints, **sub} if isinstance(sub, dict) else sub, f"{name}{index}")
+                    for index, sub in enumerate(any_of)
+                ]
+            )
+
+        if "const" in schema:
+            return self.literal([schema["const"]])
+
+        if enum := schema.get("enum"):
+            return self.literal(enum)
+
+        match type := schema.get("type"):
+            case list():
+                return self.union([self.compile({**schema, "type": t}, name) for t in type])
+            case "object":
+                if schema.get("properties"):
+                    return self.build_object(schema, name)
+                if isinstance(additional := schema.get("additionalProperties"), dict):
+                    return dict[str, self.compile(additional, f"{name}Value")]  # type: ignore[misc]
+                return dict[str, Any]
+            case "array":
+                if isinstance(items := schema.get("items"), dict):
+                    return self.constrain(list[self.compile(items, f"{name}Item")], schema)  # type: ignore[misc]
+                return self.constrain(list[Any], schema)
+            case None:
+                if schema.get("properties"):
+                    return self.build_object(schema, name)
+                return Any
+            case _:
+                return self.constrain(JSON_TYPES.get(type, Any), schema)
+
+    def constrain(self, annotation: Any, schema: dict[str, Any]) -> Any:
+        """Attach constraints applicable to the schema type."""
+        kwargs = {
+            constraint: value
+            for keyword, constraint in FIELD_CONSTRAINTS.get(schema["type"], {}).items()
+            if (value := schema.get(keyword)) is not None and not isinstance(value, bool)
+        }
+        return Annotated[annotation, Field(**kwargs)] if kwargs else annotation
+
+    def merge(self, schemas: list[dict[str, Any]]) -> dict[str, Any]:
+        """Merge `allOf` schemas."""
+        merged: dict[str, Any] = {"type": "object", "properties": {}, "required": []}
+        for schema in schemas:
+            if (ref := schema.get("$ref") or schema.get("ref")) and ref not in self.resolving:
+                schema = self.resolve(ref)
+            for key, value in schema.items():
+                match key:
+                    case "properties":
+                        merged["properties"].update(value)
+                    case "required":
+                        merged["required"].extend(value)
+                    case _:
+                        merged.setdefault(key, value)
+        return merged
+
+    def union(self, types: list[Any]) -> Any:
+        """Build union annotation."""
+        unique: list[Any] = []
+        for type in types:
+            if type not in unique:
+                unique.append(type)
+
+        if len(unique) == 1:
+            return unique[0]
+        return Union[tuple(unique)]
+
+    def literal(self, values: list[Any]) -> Any:
+        """Build literal annotation."""
+        if any(isinstance(value, dict | list) for value in values):
+            return Any
+        if None in values:
+            if not (values := [value for value in values if value is not None]):
+                return None
+            return Optional[Literal[tuple(values)]]
+        return Literal[tuple(values)]
+
+    def field_name(self, name: str, taken: Collection[str]) -> str:
+        """Sanitize property name into valid field name."""
+        field = "".join(c if c.isalnum() or c == "_" else "_" for c in name)
+        if not field or field[0].isdigit() or field[0] == "_" or iskeyword(field):
+            field = f"field_{field.lstrip('_')}"
+        if hasattr(self.reserved, field) or field.startswith("model_"):
+            field = f"{field}_"
+        while field in taken:
+            field = f"{field}_"
+        return field
+
+    def build_object(self, schema: dict[str, Any], name: str) -> type[BaseModel]:
+        """Build pydantic model from object schema."""
+        required = set(schema.get("required") or ())
+        fields: dict[str, Any] = {}
+        aliased = False
+        for key, prop in (schema.get("properties") or {}).items():
+            prop = prop if isinstance(prop, dict) else {}
+            annotation = self.compile(prop, to_class_name(f"{name}_{key}"))
+
+            kwargs: dict[str, Any] = {}
+            if description := prop.get("description"):
+                kwargs["description"] = description
+            if title := prop.get("title"):
+                kwargs["title"] = title
+
+            if (field := self.field_name(key, fields.keys())) != key:
+                kwargs["alias"] = key
+                aliased = True
+
+            if key in required:
+                default: Any = ...
+            else:
+                default = prop.get("default")
+                if default is None:
+                    annotation = Optional[annotation]
+
+            fields[field] = (annotation, Field(default, **kwargs))
+
+        config = ConfigDict(
+            extra="forbid" if schema.get("additionalProperties") is False else "ignore",
+            populate_by_name=aliased,
+            serialize_by_alias=aliased,  # pydantic>=2.11, remote calls also dump by_alias
+        )
+
+        model = create_model(name, __config__=config, __module__=__name__, **fields)
+        if description := schema.get("description"):
+            model.__doc__ = description
+        return model
+
+
+def build_model(schema: dict[str, Any], class_name: str, reserved: type[BaseModel] = BaseModel) -> type[BaseModel]:
+    """Build pydantic model from JSON Schema."""
+    return SchemaCompiler(schema, reserved).build(class_name)
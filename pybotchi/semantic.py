@@ -0,0 +1,169 @@
+"""Pybotchi Semantic Cache."""
+
+from collections.abc import Hashable, Sequence
+from math import isqrt
+from os import getenv
+from threading import Lock
+from time import time
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .cache import LRUCache
+
+
+class VectorIndex:
+    """Cosine similarity index of normalized vectors.
+
+    Searches by brute force until `ivf_threshold` vectors are stored, then builds an
+    IVF index: vectors are partitioned around k-means centroids and only the
+    `nprobe` nearest partitions are scanned.
+    """
+
+    def __init__(self, dim: int, maxsize: int, ivf_threshold: int, nprobe: int, ttl: float) -> None:
+        """Initialize index."""
+        self.dim = dim
+        self.maxsize = maxsize
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self.ttl = ttl
+        self.size = 0
+        self.vectors: NDArray[np.float32] = np.empty((16, dim), dtype=np.float32)
+        self.expires_at: NDArray[np.float64] = np.empty(16, dtype=np.float64)
+        self.values: list[Any] = []
+        self.centroids: NDArray[np.float32] | None = None
+        self.partitions: NDArray[np.intp] = np.empty(16, dtype=np.intp)
+        self.trained_size = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def normalize(vector: Sequence[float] | NDArray[Any]) -> NDArray[np.float32]:
+        """Get unit length vector."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def add(self, vector: NDArray[np.float32], value: Any) -> None:
+        """Add normalized vector, dropping the oldest entry when full."""
+        with self._lock:
+            if self.size >= self.maxsize:
+                self.vectors[: self.size - 1] = self.vectors[1 : self.size]
+                self.expires_at[: self.size - 1] = self.expires_at[1 : self.size]
+                self.partitions[: self.size - 1] = self.partitions[1 : self.size]
+                self.values.pop(0)
+                self.size -= 1
+            elif self.size >= len(self.vectors):
+                capacity = min(len(self.vectors) * 2, self.maxsize)
+                self.vectors = np.resize(self.vectors, (capacity, self.dim))
+                self.expires_at = np.resize(self.expires_at, capacity)
+                self.partitions = np.resize(self.partitions, capacity)
+
+            self.vectors[self.size] = vector
+            self.expires_at[self.size] = time() + self.ttl
+            self.values.append(value)
+            self.size += 1
+
+            if self.size >= self.ivf_threshold and self.size >= self.trained_size * 2:
+                self.train()
+            elif self.centroids is not None:
+                self.partitions[self.size - 1] = int(np.argmax(self.centroids @ vector))
+
+    def train(self, iterations: int = 10) -> None:
+        """Partition vectors with k-means."""
+        vectors = self.vectors[: self.size]
+        count = max(isqrt(self.size), 1)
+        rng = np.random.default_rng(0)
+        centroids = vectors[rng.choice(self.size, count, replace=False)].copy()
+        for _ in range(iterations):
+            partitions = np.argmax(vectors @ centroids.T, axis=1)
+            for index in range(count):
+                if (members := vectors[partitions == index]).size:
+                    centroids[index] = self.normalize(members.mean(axis=0))
+        self.centroids = centroids
+        self.partitions[: self.size] = np.argmax(vectors @ centroids.T, axis=1)
+        self.trained_size = self.size
+
+    def search(self, vector: NDArray[np.float32]) -> tuple[float, Any] | None:
+        """Get most similar unexpired value and its score."""
+        with self._lock:
+            if not self.size:
+                return None
+
+            candidates = np.arange(self.size)
+            if self.centroids is not None:
+                probes = np.argsort(self.centroids @ vector)[-self.nprobe :]
+                candidates = candidates[np.isin(self.partitions[: self.size], probes)]
+            candidates = candidates[self.expires_at[candidates] > time()]
+            if not candidates.size:
+                return None
+
+            scores = self.vectors[candidates] @ vector
+            best = int(np.argmax(scores))
+            return float(scores[best]), self.values[candidates[best]]
+
+
+class SemanticCache:
+    """Process level semantic cache of child selection decisions.
+
+    One index per scope (action class and its bound tools/model), so decisions are
+    only reused for the same set of children.
+    """
+
+    def __init__(
+        self,
+        embedding: str = "embedding",
+        turns: int = 1,
+        maxsize: int = 10000,
+        ivf_threshold: int = 4096,
+        nprobe: int = 8,
+        ttl: float = 3600,
+    ) -> None:
+        """Initialize cache."""
+        self.embedding = embedding
+        self.turns = turns
+        self.maxsize = maxsize
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self.ttl = ttl
+        self.indexes: LRUCache[Hashable, VectorIndex] = LRUCache(int(getenv("SEMANTIC_CACHE_SCOPES", "256")))
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, scope: Hashable, vector: NDArray[np.float32], threshold: float) -> Any | None:
+        """Get cached value if similarity reaches the threshold."""
+        if (index := self.indexes.get(scope)) is not None and (found := index.search(vector)) and found[0] >= threshold:
+            self.hits += 1
+            return found[1]
+        self.misses += 1
+        return None
+
+    def set(self, scope: Hashable, vector: NDArray[np.float32], value: Any) -> None:
+        """Cache value."""
+        if (index := self.indexes.get(scope)) is None or index.dim != len(vector):
+            index = VectorIndex(len(vector), self.maxsize, self.ivf_threshold, self.nprobe, self.ttl)
+            self.indexes.set(scope, index)
+        index.add(vector, value)
+
+    def clear(self) -> None:
+        """Remove all indexes and reset counters."""
+        self.indexes.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics."""
+        return {
+            "scopes": len(self.indexes),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+SEMANTIC_CACHE = SemanticCache(
+    getenv("SEMANTIC_CACHE_EMBEDDING", "embedding"),
+    int(getenv("SEMANTIC_CACHE_TURNS", "1")),
+    int(getenv("SEMANTIC_CACHE_SIZE", "10000")),
+    int(getenv("SEMANTIC_CACHE_IVF_THRESHOLD", "4096")),
+    int(getenv("SEMANTIC_CACHE_NPROBE", "8")),
+    float(getenv("SEMANTIC_CACHE_TTL", "3600")),
+)
@@ -1,11 +1,12 @@
 """Pybotchi Utilities."""
 
 from collections import deque
-from collections.abc import Generator
+from collections.abc import Generator, ItemsView, Iterable, Iterator, ValuesView
 from contextlib import suppress
+from copy import deepcopy
 from importlib import import_module
 from re import Pattern, compile, sub
-from typing import Any, Callable
+from typing import Any, Callable, Self
 from uuid import UUID
 
 from orjson import loads
@@ -51,6 +52,140 @@ def unwrap_exceptions(
         yield exception
 
 
+IMMUTABLE_TYPES = frozenset({str, bytes, int, float, complex, bool, type(None)})
+
+
+class CowDict(dict[str, Any]):
+    """Dict sharing values with its copies until they are accessed.
+
+    `share()` freezes current mutable values on every holder. Reading or writing a
+    shared key gives that side its own deep copy, so nested mutations never leak
+    across. Copies happen on access, not on nested mutation, since returned values
+    are plain objects. The last holder of a value, including one whose copies were
+    discarded, keeps it without copying.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize dict."""
+        super().__init__(*args, **kwargs)
+        self._shared: dict[str, list[int]] = {}
+
+    def share(self) -> Self:
+        """Get copy-on-write copy."""
+        copy = self.__class__()
+        dict.update(copy, super().items())
+        for key, value in super().items():
+            if type(value) not in IMMUTABLE_TYPES:
+                holders = self._shared.setdefault(key, [1])
+                holders[0] += 1
+                copy._shared[key] = holders
+        return copy
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle with own values."""
+        return self.__class__, (dict(self.items()),)
+
+    def __del__(self) -> None:
+        """Release shared values."""
+        for key in [*getattr(self, "_shared", ())]:
+            self._release(key)
+
+    def _release(self, key: str) -> bool:
+        """Stop holding shared value and check if other holders remain."""
+        if (holders := self._shared.pop(key, None)) is None:
+            return False
+        holders[0] -= 1
+        return holders[0] > 0
+
+    def _own(self, key: str) -> None:
+        if self._release(key):
+            super().__setitem__(key, deepcopy(super().__getitem__(key)))
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate keys.
+
+        Overridden so `dict(...)`, `{**...}` and `dict.update` read values through
+        `__getitem__` instead of CPython's raw dict copy.
+        """
+        return super().__iter__()
+
+    def __getitem__(self, key: str) -> Any:
+        """Get own value."""
+        self._own(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set own value."""
+        self._release(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Delete value."""
+        self._release(key)
+        super().__delitem__(key)
+
+    def __or__(self, other: Any) -> dict[str, Any]:  # type: ignore[override]
+        """Merge into new dict."""
+        return {**dict(self.items()), **other}
+
+    def __ior__(self, other: Any) -> Self:  # type: ignore[misc,override]
+        """Update in place."""
+        self.update(other)
+        return self
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get own value or default."""
+        if key not in self:
+            return default
+        return self[key]
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Get own value, setting default if missing."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove key and return own value."""
+        if key in self:
+            self._own(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        """Remove last item and return it with own value."""
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Update own values."""
+        for other in (*args, kwargs):
+            items: Iterable[tuple[str, Any]] = other.items() if hasattr(other, "items") else other
+            for key, value in items:
+                self[key] = value
+
+    def clear(self) -> None:
+        """Remove all items."""
+        for key in [*self._shared]:
+            self._release(key)
+        super().clear()
+
+    def copy(self) -> Self:
+        """Get copy-on-write copy."""
+        return self.share()
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        """Get own values."""
+        for key in [*self._shared]:
+            self._own(key)
+        return super().values()
+
+    def items(self) -> ItemsView[str, Any]:  # type: ignore[override]
+        """Get items with own values."""
+        for key in [*self._shared]:
+            self._own(key)
+        return super().items()
+
+
 for module, attr in (("uuid", "uuid7"), ("uuid6", "uuid7"), ("uuid", "uuid4")):
     with suppress(ImportError, AttributeError):
         uuid: Callable[[], UUID] = getattr(import_module(module), attr)
@@ -0,0 +1,103 @@
+"""Action execution tests."""
+
+from asyncio import run, sleep
+
+from pytest import raises
+
+from pybotchi import Action, Context
+
+LOG: list[tuple[str, str]] = []
+
+
+class Step(Action):
+    """Logged step."""
+
+    __concurrent__ = True
+
+    async def pre(self, context: Context) -> None:
+        """Log step start and end."""
+        LOG.append((self.__class__.__name__, "start"))
+        await sleep(0.01)
+        LOG.append((self.__class__.__name__, "end"))
+
+
+class A(Step):
+    """A."""
+
+
+class B(Step):
+    """B."""
+
+    __depends_on__ = ("A",)
+
+
+class C(Step):
+    """C."""
+
+    __depends_on__ = (B, "B", "Missing")
+
+
+class Serial1(Step):
+    """Non concurrent step."""
+
+    __concurrent__ = False
+
+
+class Serial2(Serial1):
+    """Non concurrent step."""
+
+
+class Cycle1(Step):
+    """Cyclic step."""
+
+    __depends_on__ = ("Cycle2",)
+
+
+class Cycle2(Step):
+    """Cyclic step."""
+
+    __depends_on__ = ("Cycle1",)
+
+
+class Agent(Action):
+    """Agent."""
+
+
+def schedule(*next_actions: Action) -> list[tuple[str, str]]:
+    """Run dependent children execution and get log."""
+    LOG.clear()
+    run(Agent().dependent_children_execution(Context(prompts=[]), list(next_actions)))
+    return list(LOG)
+
+
+def test_dependencies_wait() -> None:
+    """Test children wait for their selected dependencies."""
+    log = schedule(C(), B(), A())
+
+    assert log.index(("A", "end")) < log.index(("B", "start"))
+    assert log.index(("B", "end")) < log.index(("C", "start"))
+
+
+def test_duplicate_dependencies() -> None:
+    """Test repeated names and classes are not reported as circular."""
+    assert len(schedule(A(), B(), C())) == 6
+
+
+def test_independent_run_concurrently() -> None:
+    """Test children without dependencies start together."""
+    log = schedule(A(), Serial1(), B())
+
+    assert log[:2] == [("A", "start"), ("Serial1", "start")]
+
+
+def test_non_concurrent_keep_order() -> None:
+    """Test non concurrent children run one after another in selection order."""
+    log = schedule(Serial2(), A(), Serial1(), B())
+
+    assert log.index(("Serial2", "end")) < log.index(("Serial1", "start"))
+
+
+def test_circular_dependencies() -> None:
+    """Test circular dependencies raise."""
+    with raises(ValueError, match="Circular"):
+        schedule(Cycle1(), Cycle2(), A())
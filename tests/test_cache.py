@@ -0,0 +1,94 @@
+"""Cache tests."""
+
+from asyncio import create_task, gather, run, sleep
+from functools import partial
+from pathlib import Path
+from sqlite3 import connect
+
+from pybotchi.cache import LLMCache, LRUCache, SingleFlight
+
+
+def test_lru_cache_evicts_least_recent() -> None:
+    """Test LRU cache evicts least recently used entries."""
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_llm_cache_expires() -> None:
+    """Test entries expire after their TTL."""
+
+    async def test() -> None:
+        cache = LLMCache(ttl=0.01)
+        await cache.set("a", {"content": "x"})
+        assert await cache.get("a") == {"content": "x"}
+        await sleep(0.02)
+        assert await cache.get("a") is None
+
+    run(test())
+
+
+def test_llm_cache_sqlite_prunes_periodically(tmp_path: Path) -> None:
+    """Test sqlite tier survives restarts and prunes expired rows in batches."""
+    path = str(tmp_path / "cache.db")
+
+    async def test() -> None:
+        cache = LLMCache(path=path, prune_interval=3600, prune_batch=1)
+        await cache.set("c", {"content": "c"})
+        await cache.set("a", {"content": "a"}, ttl=0)
+        await cache.set("b", {"content": "b"}, ttl=0)
+
+        assert await LLMCache(path=path).get("c") == {"content": "c"}
+        assert connect(path).execute("SELECT count(*) FROM llm_cache").fetchone()[0] == 3
+
+        cache.pruned_at = 0
+        await cache.set("d", {"content": "d"})
+        assert connect(path).execute("SELECT count(*) FROM llm_cache").fetchone()[0] == 3
+
+    run(test())
+
+
+def test_single_flight_shares_concurrent_calls() -> None:
+    """Test concurrent calls with identical keys run once."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls: list[str] = []
+
+    async def call(key: str) -> int:
+        calls.append(key)
+        number = len(calls)
+        await sleep(0.01)
+        return number
+
+    async def test() -> None:
+        results = await gather(*(flight.do(key, partial(call, key)) for key in ("a", "a", "b")))
+        assert results == [(1, False), (1, True), (2, False)]
+        assert await flight.do("a", partial(call, "a")) == (3, False)
+
+    run(test())
+    assert calls == ["a", "b", "a"]
+    assert flight.stats() == {"in_flight": 0, "executed": 3, "shared": 1}
+
+
+def test_single_flight_retries_cancelled_call() -> None:
+    """Test waiting callers run the call themselves when the first caller is cancelled."""
+    flight: SingleFlight[str, str] = SingleFlight()
+
+    async def call(result: str) -> str:
+        await sleep(0.01)
+        return result
+
+    async def test() -> None:
+        first = create_task(flight.do("a", partial(call, "first")))
+        await sleep(0)
+        second = create_task(flight.do("a", partial(call, "second")))
+        await sleep(0)
+        first.cancel()
+        assert await second == ("second", False)
+
+    run(test())
@@ -0,0 +1,133 @@
+"""LLM tests."""
+
+from asyncio import create_task, gather, run, sleep
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pytest import MonkeyPatch, raises
+
+from pybotchi import Action, Context
+from pybotchi.llm import LLM, LLMPool
+
+
+class Echo(BaseChatModel):
+    """Chat model answering its model name."""
+
+    model_name: str
+    fail: bool = False
+    delay: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "echo"
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        if self.fail:
+            raise ValueError(self.model_name)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.model_name))])
+
+    async def _agenerate(
+        self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        await sleep(self.delay)
+        return self._generate(messages)
+
+
+def test_pool_reports_serving_member() -> None:
+    """Test failed calls fail over and the serving member is reported."""
+    pool = LLMPool(members=[Echo(model_name="a", fail=True), Echo(model_name="b")], strategy="round_robin")
+
+    for message in (pool.invoke("hi"), run(pool.ainvoke("hi"))):
+        assert message.content == "b"
+        assert message.response_metadata["model_name"] == "b"
+    assert pool.model_name == "a"
+
+
+def test_pool_ejects_failing_member() -> None:
+    """Test members failing `max_failures` times in a row are ejected."""
+    pool = LLMPool(members=[Echo(model_name="a", fail=True), Echo(model_name="b")], max_failures=2)
+
+    for _ in range(4):
+        pool.invoke("hi")
+
+    assert [state["ejected"] for state in pool.stats()] == [True, False]
+    assert pool.candidates()[0].llm.model_name == "b"
+
+
+def test_pool_without_failover_raises() -> None:
+    """Test failed calls raise when failover is disabled."""
+    pool = LLMPool(members=[Echo(model_name="a", fail=True), Echo(model_name="b", fail=True)], failover=False)
+
+    with raises(ValueError):
+        pool.invoke("hi")
+    assert sum(state["failures"] for state in pool.stats()) == 1
+
+
+def test_pool_balances_in_flight() -> None:
+    """Test concurrent calls go to the least busy members."""
+    pool = LLMPool(members=[Echo(model_name="a", delay=0.01), Echo(model_name="b", delay=0.01)])
+
+    async def test() -> list[Any]:
+        return await gather(pool.ainvoke("hi"), pool.ainvoke("hi"))
+
+    assert sorted(message.content for message in run(test())) == ["a", "b"]
+
+
+def test_pool_cancel_releases_member() -> None:
+    """Test cancelled calls release members without counting failures."""
+    pool = LLMPool(members=[Echo(model_name="a", delay=1)])
+
+    async def test() -> None:
+        task = create_task(pool.ainvoke("hi"))
+        await sleep(0.01)
+        task.cancel()
+        await gather(task, return_exceptions=True)
+
+    run(test())
+    assert pool.stats()[0]["in_flight"] == 0
+    assert pool.stats()[0]["failures"] == 0
+
+
+def test_hedge_requires_registered_alternate(monkeypatch: MonkeyPatch) -> None:
+    """Test hedging policies reject unregistered alternates."""
+    monkeypatch.setattr(LLM, "__instances__", {"base": Echo(model_name="a")})
+    monkeypatch.setattr(LLM, "__hedges__", {})
+
+    with raises(NotImplementedError):
+        LLM.hedge("base", alternate="west")
+    assert LLM.hedge("base").alternate is None
+
+
+def test_hedge_skips_unregistered_action_alternate(monkeypatch: MonkeyPatch) -> None:
+    """Test action level hedging falls back to a plain call when the alternate is missing."""
+    base = Echo(model_name="a")
+    monkeypatch.setattr(LLM, "__instances__", {"base": base})
+    monkeypatch.setattr(LLM, "__hedges__", {})
+
+    class Hedged(Action):
+        """Hedged action."""
+
+        __hedge__ = "west"
+
+    message, answered = run(Context(prompts=[]).hedged_invoke(Hedged(), base, [{"role": "user", "content": "hi"}]))
+    assert (message.content, answered) == ("a", base)
+    assert LLM.hedges()["base"]["samples"] == 1
+
+
+def test_pool_delegates_provider_detection() -> None:
+    """Test pools and bindings report the provider of their members."""
+
+    class Claude(Echo):
+        @property
+        def _llm_type(self) -> str:
+            return "anthropic-chat"
+
+    context = Context(prompts=[])
+    pool = LLMPool(members=[Claude(model_name="a"), Claude(model_name="b")])
+
+    assert context.is_anthropic(pool.bind(tool_choice="any"))
+    assert not context.is_anthropic(LLMPool(members=[Echo(model_name="a")]))
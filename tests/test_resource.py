@@ -0,0 +1,97 @@
+"""Resource tests."""
+
+from asyncio import create_task, gather, run, sleep
+from threading import Thread
+
+from pybotchi.resource import RateLimiter, Semaphore
+
+
+def test_semaphore_limits_concurrency_in_order() -> None:
+    """Test semaphore caps concurrent holders and grants slots FIFO."""
+    semaphore = Semaphore(2)
+    active: list[int] = []
+    peak: list[int] = []
+    order: list[int] = []
+
+    async def hold(index: int) -> None:
+        async with semaphore.slot():
+            order.append(index)
+            active.append(index)
+            peak.append(len(active))
+            await sleep(0.01)
+            active.remove(index)
+
+    async def test() -> None:
+        await gather(*(hold(index) for index in range(6)))
+
+    run(test())
+    assert max(peak) == 2
+    assert order == list(range(6))
+    assert semaphore.available == 2
+
+
+def test_semaphore_cancelled_waiter() -> None:
+    """Test cancelled waiters do not leak slots."""
+    semaphore = Semaphore(1)
+
+    async def test() -> None:
+        await semaphore.acquire()
+        waiter = create_task(semaphore.acquire())
+        await sleep(0)
+        waiter.cancel()
+        await gather(waiter, return_exceptions=True)
+        semaphore.release()
+
+    run(test())
+    assert semaphore.available == 1
+    assert semaphore.waiting == 0
+
+
+def test_semaphore_across_event_loops() -> None:
+    """Test slots are handed over between event loops on other threads."""
+    semaphore = Semaphore(1)
+    active: list[int] = []
+    peak: list[int] = []
+
+    async def hold() -> None:
+        async with semaphore.slot():
+            active.append(1)
+            peak.append(len(active))
+            await sleep(0.01)
+            active.pop()
+
+    threads = [Thread(target=run, args=(hold(),)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 1
+    assert semaphore.available == 1
+
+
+def test_rate_limiter_requests() -> None:
+    """Test requests queue once the RPM bucket is empty."""
+    limiter = RateLimiter(rpm=600)
+
+    async def test() -> list[float]:
+        return [await limiter.acquire() for _ in range(602)]
+
+    waits = run(test())
+    assert not any(waits[:600])
+    assert all(wait > 0 for wait in waits[600:])
+    assert limiter.stats()["waited"] == 2
+
+
+def test_rate_limiter_tokens_and_reconcile() -> None:
+    """Test token estimates are debited upfront and reconciled with actual usage."""
+    limiter = RateLimiter(tpm=6000)
+
+    async def test() -> None:
+        assert await limiter.acquire(5000) == 0
+        limiter.reconcile(5000, 1000)
+        assert await limiter.acquire(4000) == 0
+        assert await limiter.acquire(1010) > 0
+
+    run(test())
+    assert limiter.stats()["tokens"] < 100
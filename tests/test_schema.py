@@ -0,0 +1,99 @@
+"""Schema compiler tests."""
+
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+from pytest import mark, raises
+
+from pybotchi.schema import build_model
+
+
+def model(properties: dict[str, Any], **schema: Any) -> type[BaseModel]:
+    """Build test model."""
+    return build_model({"type": "object", "properties": properties, **schema}, "Model")
+
+
+def test_required_and_optional() -> None:
+    """Test required and optional properties."""
+    compiled = model({"a": {"type": "string"}, "b": {"type": "integer", "default": 3}}, required=["a"])
+
+    assert compiled(a="x").model_dump() == {"a": "x", "b": 3}
+    with raises(ValidationError):
+        compiled()
+
+
+def test_nested_refs_and_arrays() -> None:
+    """Test `$ref`, nested objects and arrays."""
+    compiled = model(
+        {"items": {"type": "array", "items": {"$ref": "#/$defs/Item"}}},
+        **{"$defs": {"Item": {"type": "object", "properties": {"id": {"type": "integer"}}, "required": ["id"]}}},
+    )
+
+    assert compiled.model_validate({"items": [{"id": 1}]}).model_dump() == {"items": [{"id": 1}]}
+    with raises(ValidationError):
+        compiled.model_validate({"items": [{}]})
+
+
+def test_recursive_ref() -> None:
+    """Test recursive references fall back to dict."""
+    compiled = model({"child": {"$ref": "#"}})
+
+    assert compiled(child={"anything": 1}).model_dump() == {"child": {"anything": 1}}
+
+
+def test_enum_const_and_all_of() -> None:
+    """Test `enum`, `const` and `allOf`."""
+    compiled = model(
+        {
+            "mode": {"enum": ["a", "b"]},
+            "kind": {"const": "fixed"},
+            "both": {
+                "allOf": [
+                    {"type": "object", "properties": {"x": {"type": "integer"}}, "required": ["x"]},
+                    {"properties": {"y": {"type": "string"}}},
+                ]
+            },
+        }
+    )
+
+    assert compiled(mode="a", kind="fixed", both={"x": 1, "y": "z"}).model_dump()["both"] == {"x": 1, "y": "z"}
+    for invalid in ({"mode": "c"}, {"kind": "other"}, {"both": {"y": "z"}}):
+        with raises(ValidationError):
+            compiled(**invalid)
+
+
+@mark.parametrize(
+    ("prop", "valid", "invalid"),
+    [
+        ({"type": "string", "minLength": 2, "pattern": "^a"}, "ab", "ba"),
+        ({"type": "integer", "minimum": 1, "exclusiveMaximum": 3}, 2, 3),
+        ({"type": "array", "minItems": 1}, [1], []),
+        ({"type": ["integer", "string"], "minimum": 1}, "x", 0),
+        ({"type": ["integer", "string"], "minimum": 1}, 1, 0),
+        ({"anyOf": [{"type": "string"}, {"type": "integer"}], "minLength": 2}, 5, "x"),
+        ({"anyOf": [{"type": "string"}, {"type": "integer"}], "minLength": 2}, "xy", "x"),
+    ],
+)
+def test_constraints(prop: dict[str, Any], valid: Any, invalid: Any) -> None:
+    """Test constraints apply only to matching types."""
+    compiled = model({"value": prop}, required=["value"])
+
+    assert compiled(value=valid).model_dump() == {"value": valid}
+    with raises(ValidationError):
+        compiled(value=invalid)
+
+
+def test_aliases() -> None:
+    """Test invalid identifiers are aliased and dumped by alias."""
+    compiled = model({"my-key": {"type": "string"}, "model_name": {"type": "string"}})
+
+    instance = compiled.model_validate({"my-key": "a", "model_name": "b"})
+    assert instance.model_dump(by_alias=True) == {"my-key": "a", "model_name": "b"}
+
+
+def test_additional_properties() -> None:
+    """Test `additionalProperties: false` forbids extras."""
+    compiled = model({"a": {"type": "string"}}, additionalProperties=False)
+
+    with raises(ValidationError):
+        compiled(a="x", b="y")
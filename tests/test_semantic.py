@@ -0,0 +1,72 @@
+"""Semantic cache tests."""
+
+from time import sleep
+from typing import Any
+
+from pytest import importorskip
+
+np = importorskip("numpy")
+
+from pybotchi.semantic import SemanticCache, VectorIndex  # noqa: E402
+
+
+def vectors(count: int, dim: int = 16) -> list[Any]:
+    """Get random normalized vectors."""
+    rng = np.random.default_rng(1)
+    return [VectorIndex.normalize(vector) for vector in rng.normal(size=(count, dim))]
+
+
+def test_index_brute_force_search() -> None:
+    """Test nearest vector is found before the IVF index is built."""
+    index = VectorIndex(16, 100, 1000, 4, 3600)
+    stored = vectors(20)
+    for position, vector in enumerate(stored):
+        index.add(vector, position)
+
+    score, value = index.search(stored[7])
+    assert value == 7
+    assert round(score, 4) == 1
+    assert index.centroids is None
+
+
+def test_index_evicts_oldest() -> None:
+    """Test the oldest entry is dropped once full."""
+    index = VectorIndex(16, 3, 1000, 4, 3600)
+    stored = vectors(4)
+    for position, vector in enumerate(stored):
+        index.add(vector, position)
+
+    assert index.values == [1, 2, 3]
+    assert index.search(stored[0])[1] != 0
+
+
+def test_index_ivf_search() -> None:
+    """Test stored vectors are still found once the IVF index is built."""
+    index = VectorIndex(16, 1000, 64, 4, 3600)
+    stored = vectors(200)
+    for position, vector in enumerate(stored):
+        index.add(vector, position)
+
+    assert index.centroids is not None
+    assert all(index.search(stored[position])[1] == position for position in range(0, 200, 7))
+
+
+def test_index_ttl() -> None:
+    """Test expired entries are not returned."""
+    index = VectorIndex(16, 10, 1000, 4, 0.01)
+    index.add(vectors(1)[0], "a")
+    sleep(0.02)
+
+    assert index.search(vectors(1)[0]) is None
+
+
+def test_cache_threshold_and_scopes() -> None:
+    """Test values are only reused above threshold and within their scope."""
+    cache = SemanticCache()
+    first, second = vectors(2)
+    cache.set("scope", first, "a")
+
+    assert cache.get("scope", first, 0.99) == "a"
+    assert cache.get("scope", second, 0.99) is None
+    assert cache.get("other", first, 0.99) is None
+    assert cache.stats() == {"scopes": 1, "hits": 1, "misses": 2}
@@ -0,0 +1,62 @@
+"""Utility tests."""
+
+from copy import deepcopy
+from pickle import dumps, loads
+from typing import Any
+
+from pybotchi.utils import CowDict
+
+
+def test_cow_dict_isolation() -> None:
+    """Test nested mutations do not leak between shared copies."""
+    parent = CowDict(items=[1], name="a")
+    child = parent.share()
+
+    child["items"].append(2)
+    parent["items"].append(3)
+    child["name"] = "b"
+
+    assert parent == {"items": [1, 3], "name": "a"}
+    assert child == {"items": [1, 2], "name": "b"}
+
+
+def test_cow_dict_merges_copy() -> None:
+    """Test merging a shared copy into plain dicts does not leak into its parent."""
+    parent = CowDict(items=[1])
+
+    def update(child: CowDict) -> dict[str, Any]:
+        merged: dict[str, Any] = {}
+        merged.update(child)
+        return merged
+
+    for merge in (dict, update, lambda child: {**child}, lambda child: child | {}):
+        merge(parent.share())["items"].append(2)
+
+    assert parent == {"items": [1]}
+
+
+def test_cow_dict_last_holder_keeps_value() -> None:
+    """Test the last holder keeps the shared value without copying."""
+    items = [1]
+    parent = CowDict(items=items)
+    child = parent.share()
+
+    assert child["items"] is not items
+    assert parent["items"] is items
+
+    other = parent.share()
+    del other
+    assert parent["items"] is items
+
+
+def test_cow_dict_pickle() -> None:
+    """Test pickled and deep copied shared copies own their values."""
+    parent = CowDict(items=[1])
+    child = parent.share()
+
+    for copied in (loads(dumps(child)), deepcopy(child)):
+        copied["items"].append(2)
+        assert isinstance(copied, CowDict)
+
+    assert parent == {"items": [1]}
+    assert child == {"items": [1]}